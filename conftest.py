@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration for the root-level test scripts.
+
+Puts the project root on sys.path once per session so the test files can
+import tools/ and frameworks/ without per-file path setup. Running a test
+script directly (python test_*.py) already has the project root on the path.
+"""
+
+import sys
+import pathlib
+
+PROJECT_ROOT = str(pathlib.Path(__file__).resolve().parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -4,10 +4,14 @@ Provides both convenience (pre-registered prompts) and flexibility (custom build
 """
 
 import os
+import re
 import importlib.util
 from typing import List, Dict, Any, Optional
 import json
 
+# WHO:/WHAT:/etc. prefixes at the start of a component line
+_PREFIX_RE = re.compile(r'^(WHO|WHAT|HOW|WHY|FORMAT):\s*', flags=re.MULTILINE)
+
 
 class PromptValidationError(Exception):
     """Raised when prompt validation fails"""
@@ -22,6 +26,7 @@ class StructuredPromptBuilder:
     def __init__(self, components_path: str = None):
         self.components_path = components_path or "prompts/structured/components"
         self._component_cache = {}
+        self._template_cache = {}
     
     def build(self, components: List[str], **variables) -> str:
         """
@@ -37,6 +42,14 @@ class StructuredPromptBuilder:
         Raises:
             PromptValidationError: If required components are missing
         """
+        return self._template(components).format(**variables)
+    
+    def _template(self, components: List[str]) -> str:
+        """Validated, assembled and cleaned template for a component list, built once"""
+        cache_key = tuple(components)
+        if cache_key in self._template_cache:
+            return self._template_cache[cache_key]
+        
         parsed_components = self._parse_components(components)
         self._validate_5w_completeness(parsed_components)
         
@@ -52,7 +65,8 @@ class StructuredPromptBuilder:
         assembled = self._assemble_natural_flow(content_parts)
         cleaned = self._clean_prefixes(assembled)
         
-        return cleaned.format(**variables)
+        self._template_cache[cache_key] = cleaned
+        return cleaned
     
     def _parse_components(self, components: List[str]) -> Dict[str, str]:
         """Parse component specs into category -> name mapping"""
@@ -104,8 +118,7 @@ class StructuredPromptBuilder:
     
     def _clean_prefixes(self, prompt: str) -> str:
         """Remove WHO:/WHAT:/etc prefixes from final output"""
-        import re
-        return re.sub(r'^(WHO|WHAT|HOW|WHY|FORMAT):\s*', '', prompt, flags=re.MULTILINE)
+        return _PREFIX_RE.sub('', prompt)
     
     def get_missing_components(self, components: List[str]) -> List[str]:
         """Debug helper to see what components are missing"""
@@ -170,6 +183,7 @@ class CreativePromptBuilder:
     def __init__(self, components_path: str = None):
         self.components_path = components_path or "prompts/creative"
         self._component_cache = {}
+        self._template_cache = {}
     
     def build(self, *component_specs, **variables) -> str:
         """
@@ -182,12 +196,10 @@ class CreativePromptBuilder:
         Returns:
             Assembled creative prompt
         """
-        content_parts = []
-        for spec in component_specs:
-            content = self._load_creative_component(spec)
-            content_parts.append(content)
-        
-        assembled = "\n\n".join(content_parts)
+        assembled = self._template_cache.get(component_specs)
+        if assembled is None:
+            assembled = "\n\n".join(self._load_creative_component(spec) for spec in component_specs)
+            self._template_cache[component_specs] = assembled
         return assembled.format(**variables)
     
     def _load_creative_component(self, component_spec: str) -> str:
@@ -4,9 +4,11 @@ NOTE: These maintain the exact same interface as the old system while using new
 This allows gradual migration with fallback capability
 """
 
+import functools
 import json
 import logging
-from typing import Tuple, Dict, Any
+import orjson
+from typing import Tuple, Dict, Any, Callable
 
 from frameworks.prompt_system import prompt_system, PromptValidationError
 from frameworks.prompt_context_builders import build_website_extraction_context, build_brand_voice_context
@@ -14,6 +16,35 @@ from frameworks.prompt_context_builders import build_website_extraction_context,
 # Set up logging for debugging prompt system issues
 logger = logging.getLogger(__name__)
 
+# Built prompts kept per get_*_prompt method, keyed on their inputs
+PROMPT_CACHE_SIZE = 256
+
+
+def _cached_prompt(build: Callable[..., Tuple[str, float]]) -> Callable[..., Tuple[str, float]]:
+    """
+    Decorate a get_*_prompt method to build its prompt once per distinct set of inputs
+    
+    Identical inputs give an identical prompt, so re-runs and retries reuse
+    the earlier string. Inputs are keyed by their JSON encoding (dicts aren't
+    hashable, and key order matters to the prompt text) and the prompt is
+    built from that same encoding, so a hit and a miss see identical inputs;
+    anything that can't be encoded is built uncached.
+    """
+    @functools.lru_cache(maxsize=PROMPT_CACHE_SIZE)
+    def build_encoded(self, encoded: bytes) -> Tuple[str, float]:
+        args, kwargs = orjson.loads(encoded)
+        return build(self, *args, **kwargs)
+    
+    @functools.wraps(build)
+    def wrapper(self, *args, **kwargs):
+        try:
+            encoded = orjson.dumps([args, kwargs])
+        except TypeError:
+            return build(self, *args, **kwargs)
+        return build_encoded(self, encoded)
+    
+    return wrapper
+
 
 class PromptWrapper:
     """
@@ -114,6 +145,7 @@ Provide strategic, actionable insights based on the company analysis.'''
             else:
                 raise e
     
+    @_cached_prompt
     def get_brand_voice_analysis_prompt(self, client_name: str, website_data: dict, form_data: dict = None) -> Tuple[str, float]:
         """
         Get brand voice analysis prompt with temperature
@@ -176,6 +208,7 @@ Provide strategic, actionable insights based on the company analysis.'''
             else:
                 raise e
     
+    @_cached_prompt
     def get_content_collection_prompt(self, brand_context: str, industry_context: str, target_channels: list = None) -> Tuple[str, float]:
         """
         Get content collection prompt for Deep Research workflow
@@ -243,6 +276,7 @@ Return only the JSON object.'''
             else:
                 raise e
     
+    @_cached_prompt
     def get_voice_audit_prompt(self, brand_profile: str, content_samples: str, industry_context: str) -> Tuple[str, float]:
         """
         Get voice audit prompt for Deep Research workflow
@@ -320,6 +354,7 @@ Return only the JSON object.'''
             else:
                 raise e
     
+    @_cached_prompt
     def get_audience_definer_prompt(self, brand_context: str, content_insights: str, voice_insights: str, industry_context: str) -> Tuple[str, float]:
         """
         Get audience definer prompt for Deep Research workflow
@@ -414,6 +449,7 @@ Return only the JSON object.'''
             else:
                 raise e
     
+    @_cached_prompt
     def get_voice_traits_builder_prompt(self, persona_profile: str, voice_analysis: str, brand_foundation: str, industry_context: str) -> Tuple[str, float]:
         """
         Get voice traits builder prompt for Deep Research workflow
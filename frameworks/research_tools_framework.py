@@ -117,66 +117,79 @@ class NotionDatabaseManager:
         try:
             # Retrieve the page
             page = self.notion.pages.retrieve(page_id=client_page_id)
-            
-            # Extract relevant properties
-            profile = {"id": client_page_id}
-            
-            # Add properties to profile
-            props = page.get("properties", {})
-            
-            # Basic properties
-            if "Name" in props and props["Name"].get("title") and props["Name"]["title"]:
-                profile["Name"] = props["Name"]["title"][0]["text"]["content"]
-            
-            if "Industry" in props and props["Industry"].get("select"):
-                profile["Industry"] = props["Industry"]["select"]["name"]
-            
-            # Research properties
-            rich_text_props = [
-                "Product_Service_Description",
-                "Current_Target_Audience",
-                "Ideal_Target_Audience",
-                "Brand_Mission",
-                "Words_Tones_To_Avoid",
-                "Website",
-                "Contact_Email",
-                "Phone_Number",
-                "Address",
-                "LinkedIn_URL",
-                "Twitter_URL",
-                "Facebook_URL",
-                "Instagram_URL",
-                "Other_Social_Media"
-            ]
-            
-            for prop in rich_text_props:
-                if prop in props and props[prop].get("rich_text") and props[prop]["rich_text"]:
-                    profile[prop] = props[prop]["rich_text"][0]["text"]["content"]
-            
-            # Multi-select properties
-            multi_select_props = [
-                "Brand_Values",
-                "Desired_Emotional_Impact",
-                "Brand_Personality"
-            ]
-            
-            for prop in multi_select_props:
-                if prop in props and props[prop].get("multi_select"):
-                    profile[prop] = [item["name"] for item in props[prop]["multi_select"]]
-            
-            # Tool status
-            if "Research_Status" in props and props["Research_Status"].get("select"):
-                profile["Research_Status"] = props["Research_Status"]["select"]["name"]
-            else:
-                profile["Research_Status"] = "Not Started"
-            
-            return profile
+            return self._parse_page(page, client_page_id)
         except Exception as e:
             st.error(f"Error retrieving client profile: {str(e)}")
             return {}
     
-    def update_client_profile(self, client_page_id, profile_data):
-        """Update a client's profile with research data"""
+    def _parse_page(self, page, client_page_id):
+        """Extract a client profile dict from a Notion page object"""
+        # Extract relevant properties
+        profile = {"id": client_page_id}
+        
+        # Add properties to profile
+        props = page.get("properties", {})
+        
+        # Basic properties
+        if "Name" in props and props["Name"].get("title") and props["Name"]["title"]:
+            profile["Name"] = props["Name"]["title"][0]["text"]["content"]
+        
+        if "Industry" in props and props["Industry"].get("select"):
+            profile["Industry"] = props["Industry"]["select"]["name"]
+        
+        # Research properties
+        rich_text_props = [
+            "Product_Service_Description",
+            "Current_Target_Audience",
+            "Ideal_Target_Audience",
+            "Brand_Mission",
+            "Words_Tones_To_Avoid",
+            "Website",
+            "Contact_Email",
+            "Phone_Number",
+            "Address",
+            "LinkedIn_URL",
+            "Twitter_URL",
+            "Facebook_URL",
+            "Instagram_URL",
+            "Other_Social_Media"
+        ]
+        
+        for prop in rich_text_props:
+            if prop in props and props[prop].get("rich_text") and props[prop]["rich_text"]:
+                profile[prop] = props[prop]["rich_text"][0]["text"]["content"]
+        
+        # Multi-select properties
+        multi_select_props = [
+            "Brand_Values",
+            "Desired_Emotional_Impact",
+            "Brand_Personality"
+        ]
+        
+        for prop in multi_select_props:
+            if prop in props and props[prop].get("multi_select"):
+                profile[prop] = [item["name"] for item in props[prop]["multi_select"]]
+        
+        # Tool status
+        if "Research_Status" in props and props["Research_Status"].get("select"):
+            profile["Research_Status"] = props["Research_Status"]["select"]["name"]
+        else:
+            profile["Research_Status"] = "Not Started"
+        
+        return profile
+    
+    def update_client_profile(self, client_page_id, profile_data, return_profile=False):
+        """Update a client's profile with research data
+        
+        Args:
+            client_page_id (str): The client's Notion page ID
+            profile_data (dict): Profile fields to write
+            return_profile (bool, optional): Also return the updated profile parsed
+                from the update response, saving a follow-up retrieve. Defaults to False.
+            
+        Returns:
+            bool, or tuple of (bool, dict) when return_profile is True
+        """
         # Build properties dict from profile data
         properties = {
             "Research_Status": {
@@ -243,15 +256,37 @@ class NotionDatabaseManager:
         
         # Update the page
         try:
-            self.notion.pages.update(
+            page = self.notion.pages.update(
                 page_id=client_page_id,
                 properties=properties
             )
+            if return_profile:
+                return True, self._parse_page(page, client_page_id)
             return True
         except Exception as e:
             st.error(f"Error updating client profile: {str(e)}")
+            if return_profile:
+                return False, {}
             return False
     
+    def update_client_profile_batch(self, client_page_id, updates):
+        """Merge several profile updates and write them in a single Notion call
+        
+        Args:
+            client_page_id (str): The client's Notion page ID
+            updates (iterable of dict): Profile field updates, later ones win
+            
+        Returns:
+            bool: True if the merged update was written
+        """
+        merged = {}
+        for update in updates:
+            merged.update(update)
+        
+        if not merged:
+            return True
+        return self.update_client_profile(client_page_id, merged)
+    
     def get_tool_completion_status(self, client_page_id):
         """Get completion status of all tools for a client"""
         if not client_page_id:
@@ -442,6 +477,21 @@ class NotionDatabaseManager:
         return step_name in workflow_data and workflow_data[step_name].get("status") == "completed"
 
 
+@st.cache_resource
+def get_db_manager():
+    """Shared NotionDatabaseManager, created once and reused across reruns"""
+    return NotionDatabaseManager()
+
+
+@st.cache_data(ttl=60)
+def get_cached_client_profile(client_page_id):
+    """Client profile fetched through the shared manager, cached briefly across reruns
+    
+    Call get_cached_client_profile.clear() after writing to a profile.
+    """
+    return get_db_manager().get_client_profile(client_page_id)
+
+
 def client_selector_sidebar(db_manager=None, allow_new_client=False):
     """Shared client selector sidebar component with option to create new client
     
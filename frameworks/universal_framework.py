@@ -164,24 +164,70 @@ def call_openai_api(prompt, model="gpt-4", temperature=0.2):
         st.error(f"OpenAI API error: {str(e)}")
         return f"Error calling OpenAI API: {str(e)}"
 
-def call_gemini_api(prompt, response_schema=None, temperature=0.2):
+def gemini_api_key_configured():
     """
-    Call Gemini API with support for structured output using responseSchema
+    Check whether a Gemini API key is available in Streamlit secrets
+    
+    Returns:
+        bool: True if google.GEMINI_API_KEY is set and non-empty
+    """
+    try:
+        return bool(st.secrets["google"]["GEMINI_API_KEY"])
+    except Exception:
+        # Missing secrets file or section
+        return False
+
+GEMINI_MODEL = "gemini-2.5-flash-preview-05-20"
+
+class GeminiAPIError(Exception):
+    """Raised when a Gemini API call fails"""
+    pass
+
+def _configured_gemini_key(genai):
+    """
+    API key the process-wide Gemini client was last configured with
+    
+    Read from the SDK's client manager; None when it can't be read, so the
+    caller reconfigures just as it would have before.
+    """
+    manager = getattr(genai.client, '_client_manager', None)
+    client_options = (getattr(manager, 'client_config', None) or {}).get('client_options')
+    if isinstance(client_options, dict):
+        return client_options.get('api_key')
+    return getattr(client_options, 'api_key', None)
+
+def _configure_gemini(api_key):
+    """
+    Configure the Gemini client for an API key, unless it already uses that key
+    
+    genai.configure drops the SDK's clients (and their open connections), so it
+    only runs when the process-wide key differs from this one: on first use,
+    or after another tool in the app configured its own key.
+    """
+    import google.generativeai as genai
+    
+    if api_key is None or _configured_gemini_key(genai) != api_key:
+        genai.configure(api_key=api_key)
+    return genai
+
+def warm_up_gemini():
+    """Open the Gemini connection ahead of the first call with a model lookup (no tokens used)"""
+    genai = _configure_gemini(st.secrets["google"]["GEMINI_API_KEY"])
+    genai.get_model(f"models/{GEMINI_MODEL}")
+
+def _gemini_model(response_schema=None, temperature=0.2):
+    """
+    Configure the Gemini client and build a model for one request
     
     Args:
-        prompt (str): The prompt to send to Gemini
         response_schema (dict, optional): Schema for structured output
         temperature (float, optional): Controls randomness in generation
         
     Returns:
-        str: The response from Gemini
+        GenerativeModel: Model configured for the request
     """
-    import google.generativeai as genai
-    import json
-    from google.api_core import exceptions
-    
     # Configure the Gemini API client
-    genai.configure(api_key=st.secrets["google"]["GEMINI_API_KEY"])
+    genai = _configure_gemini(st.secrets["google"]["GEMINI_API_KEY"])
     
     # Create generation config
     generation_config = {
@@ -196,13 +242,31 @@ def call_gemini_api(prompt, response_schema=None, temperature=0.2):
         generation_config["response_schema"] = response_schema
         generation_config["response_mime_type"] = "application/json"
     
-    try:
-        # Create the model
-        model = genai.GenerativeModel(
-            model_name="gemini-2.5-flash-preview-05-20",
-            generation_config=generation_config
-        )
+    return genai.GenerativeModel(
+        model_name=GEMINI_MODEL,
+        generation_config=generation_config
+    )
+
+def call_gemini_api(prompt, response_schema=None, temperature=0.2):
+    """
+    Call Gemini API with support for structured output using responseSchema
+    
+    Args:
+        prompt (str): The prompt to send to Gemini
+        response_schema (dict, optional): Schema for structured output
+        temperature (float, optional): Controls randomness in generation
         
+    Returns:
+        str: The response from Gemini
+        
+    Raises:
+        GeminiAPIError: If the call fails
+    """
+    from google.api_core import exceptions
+    
+    model = _gemini_model(response_schema, temperature)
+    
+    try:
         # Generate content
         response = model.generate_content(prompt)
         
@@ -225,7 +289,36 @@ def call_gemini_api(prompt, response_schema=None, temperature=0.2):
     
     except exceptions.GoogleAPIError as e:
         st.error(f"Gemini API error: {str(e)}")
-        return f"Error calling Gemini API: {str(e)}"
+        raise GeminiAPIError(f"Error calling Gemini API: {str(e)}") from e
     except Exception as e:
         st.error(f"Unexpected error: {str(e)}")
-        return f"Error: {str(e)}"
\ No newline at end of file
+        raise GeminiAPIError(f"Error: {str(e)}") from e
+
+def call_gemini_api_stream(prompt, response_schema=None, temperature=0.2):
+    """
+    Stream a Gemini response, yielding text as it is generated
+    
+    Lets callers show or process output while the rest is still being
+    generated; ''.join() of the chunks equals the call_gemini_api response.
+    Failures raise GeminiAPIError, as with call_gemini_api; one can arrive
+    after chunks have already been used.
+    
+    Args:
+        prompt (str): The prompt to send to Gemini
+        response_schema (dict, optional): Schema for structured output
+        temperature (float, optional): Controls randomness in generation
+        
+    Yields:
+        str: Successive pieces of the response
+        
+    Raises:
+        GeminiAPIError: If the call fails, before or during the stream
+    """
+    model = _gemini_model(response_schema, temperature)
+    
+    try:
+        for chunk in model.generate_content(prompt, stream=True):
+            if chunk.text:
+                yield chunk.text
+    except Exception as e:
+        raise GeminiAPIError(f"Error calling Gemini API: {str(e)}") from e
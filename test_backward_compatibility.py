@@ -4,8 +4,6 @@ Test backward compatibility of the updated brand_builder.py
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 
 def test_legacy_functions():
@@ -62,6 +60,22 @@ def test_comprehensive_analysis():
         return False
 
 
+def test_star_import():
+    """Test that a star import only pulls in names the package can provide"""
+    print("\n⭐ Testing star import...")
+    
+    import tools.brand_builder as package
+    
+    namespace = {}
+    exec("from tools.brand_builder import *", namespace)
+    exported = set(package.__all__)
+    return (
+        {'WorkflowStep', 'WorkflowContext', 'StepResult', 'BrandBuilderWorkflow'} <= exported and
+        all(name in namespace for name in exported) and
+        all(hasattr(package, name) for name in exported)
+    )
+
+
 def main():
     """Test backward compatibility"""
     print("🧪 Testing Brand Builder Backward Compatibility")
@@ -69,7 +83,8 @@ def main():
     
     tests = [
         ("Legacy Functions", test_legacy_functions),
-        ("Comprehensive Analysis", test_comprehensive_analysis)
+        ("Comprehensive Analysis", test_comprehensive_analysis),
+        ("Star Import", test_star_import)
     ]
     
     results = []
@@ -81,23 +96,24 @@ def main():
             print(f"❌ {test_name} test crashed: {e}")
             results.append((test_name, False))
     
-    print("\n" + "=" * 50)
-    print("🎯 COMPATIBILITY TEST RESULTS:")
+    # Build the summary block and emit it in a single write
+    log = ["\n" + "=" * 50, "🎯 COMPATIBILITY TEST RESULTS:"]
     
     passed = 0
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"  {status}: {test_name}")
+        log.append(f"  {status}: {test_name}")
         if result:
             passed += 1
     
-    print(f"\n🏆 {passed}/{len(results)} tests passed")
+    log.append(f"\n🏆 {passed}/{len(results)} tests passed")
     
     if passed == len(results):
-        print("🎉 Perfect backward compatibility! Existing code will work unchanged.")
+        log.append("🎉 Perfect backward compatibility! Existing code will work unchanged.")
     else:
-        print("⚠️  Some compatibility issues found.")
+        log.append("⚠️  Some compatibility issues found.")
     
+    sys.stdout.write("\n".join(log) + "\n")
     return passed == len(results)
 
 
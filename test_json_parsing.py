@@ -3,12 +3,10 @@
 Test script to isolate and fix JSON parsing issues
 """
 
-import json
 import sys
-import os
+import orjson
 
-# Add the project path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tools.brand_builder._json import robust_json_parse
 
 # Test JSON samples that are causing issues
 test_responses = [
@@ -18,62 +16,55 @@ test_responses = [
 { "brand_mission": "To capture authentic and timeless moments", "brand_values": ["Quality", "Authenticity"] }
 ```''',
     
+    {"brand_mission": "To capture authentic and timeless moments", "brand_values": ["Quality", "Authenticity"]},
+    
     '{ "brand_mission": "To passionately capture authentic and timeless moments, celebrating love and life\'s milestones through artfully crafted photography that tells a unique story.", "brand_personality_traits": ["Sophisticated", "Warm", "Approachable"]}',
 ]
 
-def robust_json_parse(response_text):
-    """
-    Robust JSON parsing with multiple fallback strategies
-    """
-    print(f"Testing response: {response_text[:100]}...")
-    
-    # Strategy 1: Direct parsing after basic cleanup
-    try:
-        clean_response = response_text.strip()
-        if clean_response.startswith('```json'):
-            clean_response = clean_response[7:]
-        if clean_response.endswith('```'):
-            clean_response = clean_response[:-3]
-        clean_response = clean_response.strip()
-        
-        result_data = json.loads(clean_response)
-        print("✅ Strategy 1 (direct parsing) succeeded")
-        return True, result_data, None
-        
-    except json.JSONDecodeError as e:
-        print(f"❌ Strategy 1 failed: {e}")
-    
-    # Strategy 2: Extract content between first { and last }
-    try:
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}')
-        if start_idx == -1 or end_idx == -1 or end_idx <= start_idx:
-            print(f"❌ Strategy 2 failed: No valid brackets (start={start_idx}, end={end_idx})")
-            return False, {}, f"No valid JSON brackets found"
-            
-        json_text = response_text[start_idx:end_idx+1]
-        print(f"Extracted JSON: {json_text[:100]}...")
-        result_data = json.loads(json_text)
-        print("✅ Strategy 2 (bracket extraction) succeeded")
-        return True, result_data, None
-        
-    except json.JSONDecodeError as e:
-        print(f"❌ Strategy 2 failed: {e}")
-    
-    # Strategy 3: Try research_tools_framework.clean_json_response
-    try:
-        # Import here to avoid dependency issues in test
-        from frameworks import research_tools_framework
-        cleaned = research_tools_framework.clean_json_response(response_text)
-        result_data = json.loads(cleaned)
-        print("✅ Strategy 3 (framework cleanup) succeeded")
-        return True, result_data, None
-        
-    except Exception as e:
-        print(f"❌ Strategy 3 failed: {e}")
-    
-    # Final fallback: Return detailed error
-    return False, {}, f"All JSON parsing strategies failed. Response: {response_text[:200]}..."
+def _expected_payload(response):
+    """Reference answer for a sample: the object between its outermost braces"""
+    if isinstance(response, dict):
+        return response
+    return orjson.loads(response[response.find('{'):response.rfind('}') + 1])
+
+# Reference answers are parsed once at import, independently of robust_json_parse
+_EXPECTED = [_expected_payload(response) for response in test_responses]
+
+def test_robust_json_parse():
+    """Every sample should parse to its reference payload"""
+    for response, expected in zip(test_responses, _EXPECTED):
+        success, data, error = robust_json_parse(response)
+        assert success, error
+        assert data == expected
+
+# Fenced responses - a ```json block, a bare ``` block, and one wrapped in
+# commentary with stray braces - all carrying the same payload
+fenced_responses = [
+    '```json\n{ "brand_values": ["Quality", "Authenticity"] }\n```',
+    '```\n{ "brand_values": ["Quality", "Authenticity"] }\n```',
+    'Here is the analysis:\n```json\n{ "brand_values": ["Quality", "Authenticity"] }\n```\nUse {brand_values} in the guide.',
+]
+
+def test_robust_json_parse_fenced():
+    """Fence markers and surrounding commentary should be stripped from the payload"""
+    for response in fenced_responses:
+        success, data, error = robust_json_parse(response)
+        assert success, error
+        assert data == {"brand_values": ["Quality", "Authenticity"]}
+
+# Responses that carry no complete JSON object - a refusal and a truncated generation
+malformed_responses = [
+    "I'm sorry, I can't help with that request.",
+    '{ "brand_mission": "To capture authentic and timeless moments", "brand_values": ["Quality", ',
+]
+
+def test_robust_json_parse_rejects_malformed():
+    """Malformed samples should fail with an error message rather than raise"""
+    for response in malformed_responses:
+        success, data, error = robust_json_parse(response)
+        assert not success
+        assert data == {}
+        assert error
 
 def test_analyze_brand_voice():
     """Test the actual analyze_brand_voice function"""
@@ -104,14 +95,16 @@ def test_analyze_brand_voice():
 if __name__ == "__main__":
     print("=== JSON Parsing Test ===\n")
     
-    for i, response in enumerate(test_responses, 1):
+    for i, (response, expected) in enumerate(zip(test_responses, _EXPECTED), 1):
         print(f"\n--- Test {i} ---")
         success, data, error = robust_json_parse(response)
         
-        if success:
-            print(f"✅ SUCCESS: Parsed {len(data)} keys")
+        if success and data == expected:
+            sys.stdout.write(f"✅ SUCCESS: Parsed {len(data)} keys matching the expected payload\n")
+        elif success:
+            sys.stdout.write(f"❌ MISMATCH: Parsed {data}, expected {expected}\n")
         else:
-            print(f"❌ FAILED: {error}")
+            sys.stdout.write(f"❌ FAILED: {error}\n")
     
     # Test the actual function that's failing
     test_analyze_brand_voice()
\ No newline at end of file
@@ -5,9 +5,16 @@ Test script for the new modular Brand Builder workflow system
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import tempfile
+import threading
+import orjson
+from dataclasses import asdict
 
-from tools.brand_builder import BrandBuilderWorkflow, WorkflowContext
+from tools.brand_builder import BrandBuilderWorkflow, WorkflowContext, WorkflowStep, StepResult
+from tools.brand_builder import _cache
+from tools.brand_builder._cache import GeminiResponseCache, LLMStepCache, MemoryCache, cached_gemini_call
+from tools.brand_builder._schema import compile_schema
+from tools.brand_builder._stream import iter_array_items
 
 
 def test_workflow_discovery():
@@ -82,7 +89,7 @@ def test_workflow_execution():
     # Run first 2 steps
     results = workflow.run_workflow(context, start_from=1, end_at=2)
     
-    success_count = sum(1 for r in results if r.success)
+    success_count = [r.success for r in results].count(True)
     print(f"✅ {success_count}/{len(results)} steps completed successfully")
     
     # Show context data accumulated
@@ -91,6 +98,344 @@ def test_workflow_execution():
     return success_count >= 1  # At least step 1 should work
 
 
+def test_step_cache():
+    """Test that a repeated step with an identical context is served from the cache"""
+    print("\n💾 Testing step result cache...")
+    
+    class CountingStep(WorkflowStep):
+        calls = 0
+        
+        def execute(self, context):
+            CountingStep.calls += 1
+            return StepResult(True, {'echo': context.get('client_name')}, [], [], self.name)
+        
+        def get_required_inputs(self):
+            return ['client_name']
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workflow = BrandBuilderWorkflow()
+        workflow._cache = LLMStepCache(path=os.path.join(tmp_dir, 'cache.sqlite3'))
+        workflow.steps = {99: CountingStep()}
+        
+        first = workflow.run_step(99, WorkflowContext({'client_name': 'Test Company'}))
+        second = workflow.run_step(99, WorkflowContext({'client_name': 'Test Company'}))
+        workflow.run_step(99, WorkflowContext({'client_name': 'Other Company'}))
+        # A field beyond the required inputs still changes what the step sees
+        workflow.run_step(99, WorkflowContext({'client_name': 'Test Company', 'industry': 'Retail'}))
+        
+        print(f"📊 Step executed {CountingStep.calls} times for 4 runs")
+        return CountingStep.calls == 3 and first == second
+
+
+def test_cache_opt_out():
+    """Test that BRAND_BUILDER_CACHE=0 sends every call to the API and disables the step cache"""
+    print("\n🚫 Testing cache opt-out...")
+    
+    calls = []
+    
+    def fake_gemini(prompt, response_schema=None, temperature=0.2):
+        calls.append(prompt)
+        return '{"ok": true}'
+    
+    previous = os.environ.get('BRAND_BUILDER_CACHE')
+    os.environ['BRAND_BUILDER_CACHE'] = '0'
+    try:
+        cached_gemini_call(fake_gemini, 'same prompt')
+        cached_gemini_call(fake_gemini, 'same prompt')
+        workflow = BrandBuilderWorkflow()
+    finally:
+        if previous is None:
+            del os.environ['BRAND_BUILDER_CACHE']
+        else:
+            os.environ['BRAND_BUILDER_CACHE'] = previous
+    
+    print(f"📊 API called {len(calls)} times for 2 identical prompts")
+    return len(calls) == 2 and not workflow.cache_enabled
+
+
+def test_response_cache_skips_broken_json():
+    """Test that truncated or schema-drifted Gemini responses are requested again rather than replayed"""
+    print("\n✂️ Testing response cache with broken responses...")
+    
+    responses = {'truncated': '{"brand_mission": "trunc', 'drifted': '{"other": 1}', 'valid': '{"brand_mission": "ok"}'}
+    calls = []
+    
+    def fake_gemini(prompt, response_schema=None, temperature=0.2):
+        calls.append(prompt)
+        return responses[prompt]
+    
+    check = compile_schema({"type": "object", "required": ["brand_mission"]})
+    previous = _cache._gemini_cache
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _cache._gemini_cache = GeminiResponseCache(path=os.path.join(tmp_dir, 'cache.sqlite3'))
+        try:
+            for prompt in responses:
+                for _ in range(2):
+                    cached_gemini_call(fake_gemini, prompt, check=check)
+        finally:
+            _cache._gemini_cache = previous
+    
+    print(f"📊 API calls per prompt: {[calls.count(prompt) for prompt in responses]}")
+    return [calls.count(prompt) for prompt in responses] == [2, 2, 1]
+
+
+def test_expired_rows_purged():
+    """Test that expired cache rows are deleted when the database is next opened"""
+    print("\n🧹 Testing expired cache row purge...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'cache.sqlite3')
+        cache = LLMStepCache(path=path)
+        cache.set('expired', StepResult(True, {}, [], [], 'step'), ttl=-1)
+        cache.set('live', StepResult(True, {}, [], [], 'step'))
+        
+        reopened = LLMStepCache(path=path)
+        keys = [row[0] for row in reopened._connect().execute("SELECT key FROM step_cache")]
+    
+    print(f"📊 Rows left: {keys}")
+    return keys == ['live']
+
+
+def test_memory_cache():
+    """Test that the in-process cache evicts least recently used entries and expires old ones"""
+    print("\n🧠 Testing memory cache...")
+    
+    cache = MemoryCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')  # 'b' is now least recently used
+    cache.set('c', 3)
+    evicts_lru = 'a' in cache and 'b' not in cache and 'c' in cache
+    
+    expiring = MemoryCache(2, ttl=0)
+    expiring.set('a', 1)
+    
+    print(f"📊 LRU eviction: {evicts_lru}, expired entry: {expiring.get('a')}")
+    return evicts_lru and expiring.get('a') is None
+
+
+def test_context_serialization():
+    """Test that a context survives a to_json/from_json round trip"""
+    print("\n📦 Testing context serialization...")
+    
+    context = WorkflowContext({'client_name': 'Test Company'})
+    context.add_step_result(StepResult(True, {'brand_values': ['Trust', 'Clarity']}, [], ['note'], 'brandanalyzer'))
+    first = context.to_json()
+    
+    restored = WorkflowContext.from_json(first)
+    print(f"📊 Serialized {len(first)} characters")
+    
+    # A result changed after serializing must not be written out stale
+    context.get_step_result('brandanalyzer').warnings.append('late note')
+    updated = WorkflowContext.from_json(context.to_json())
+    return (
+        restored.data == context.data and
+        restored.step_results['brandanalyzer'].warnings == ['note'] and
+        updated.step_results['brandanalyzer'].warnings == ['note', 'late note']
+    )
+
+
+def test_slotted_containers():
+    """Test that the per-step containers stay __dict__-free"""
+    print("\n🧱 Testing slotted containers...")
+    
+    result = StepResult(True, {}, [], [], 'websiteextractor')
+    context = WorkflowContext({'client_name': 'Test Company'})
+    return not hasattr(result, '__dict__') and not hasattr(context, '__dict__')
+
+
+def test_fatal_errors():
+    """Test that a FATAL error stops the workflow even when appended after construction"""
+    print("\n🛑 Testing FATAL error detection...")
+    
+    result = StepResult(True, {}, [], [], 'brandanalyzer')
+    before = result.can_continue()
+    result.errors.append("FATAL: client record missing")
+    return before and not result.can_continue() and 'has_fatal' not in asdict(result)
+
+
+def test_checkpoint_resume():
+    """Test that a failed run resumes from its checkpoint without redoing earlier steps"""
+    print("\n⏯️  Testing checkpoint resume...")
+    
+    calls = []
+    
+    class FirstStep(WorkflowStep):
+        def execute(self, context):
+            calls.append(1)
+            return StepResult(True, {'first': 'done'}, [], [], self.name)
+    
+    class SecondStep(WorkflowStep):
+        def execute(self, context):
+            calls.append(2)
+            success = len(calls) > 2  # Fail on the first attempt only
+            return StepResult(success, {'second': 'done'}, [] if success else ['flaky'], [], self.name)
+        
+        def get_dependencies(self):
+            return ['step_01_first']
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        checkpoint = os.path.join(tmp_dir, 'checkpoint.json')
+        workflow = BrandBuilderWorkflow(cache_enabled=False)
+        workflow._module_names = {}
+        workflow.steps = {1: FirstStep(), 2: SecondStep()}
+        workflow._set_step_order(workflow.steps)
+        
+        workflow.run_workflow(WorkflowContext({'client_name': 'Test Company'}), checkpoint_path=checkpoint)
+        with open(checkpoint, 'rb') as f:
+            saved = orjson.loads(f.read())['context']['data'] == {'client_name': 'Test Company', 'first': 'done'}
+        
+        context = WorkflowContext({'client_name': 'Test Company'})
+        results = workflow.run_workflow(context, checkpoint_path=checkpoint)
+        
+        print(f"📊 Step calls across both runs: {calls}")
+        return (
+            saved and calls == [1, 2, 2] and
+            [r.success for r in results] == [True] and
+            context.get('first') == 'done' and
+            not os.path.exists(checkpoint)
+        )
+
+
+def test_parallel_steps():
+    """Test that steps depending only on the same earlier step run concurrently"""
+    print("\n🔀 Testing parallel step scheduling...")
+    
+    # Each sibling waits for the other, so a sequential run would time out
+    barrier = threading.Barrier(2, timeout=5)
+    
+    class RootStep(WorkflowStep):
+        def execute(self, context):
+            return StepResult(True, {'root': 'done'}, [], [], self.name)
+    
+    class SiblingStep(WorkflowStep):
+        def __init__(self, field):
+            super().__init__()
+            self.field = field
+        
+        def execute(self, context):
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                return StepResult(False, {}, ['ran alone'], [], self.name)
+            return StepResult(True, {self.field: context.get('root')}, [], [], self.name)
+        
+        def get_dependencies(self):
+            return ['step_01_root']
+    
+    workflow = BrandBuilderWorkflow(cache_enabled=False)
+    workflow._module_names = {}
+    workflow.steps = {1: RootStep(), 2: SiblingStep('left'), 3: SiblingStep('right')}
+    workflow._set_step_order(workflow.steps)
+    
+    context = WorkflowContext({'client_name': 'Test Company'})
+    results = workflow.run_workflow(context)
+    
+    print(f"📊 Step outcomes: {[r.success for r in results]}")
+    return (
+        [r.success for r in results] == [True, True, True] and
+        context.get('left') == 'done' and context.get('right') == 'done'
+    )
+
+
+def test_schema_check():
+    """Test that a compiled schema flags missing and mistyped response fields"""
+    print("\n🧾 Testing response schema checks...")
+    
+    check = compile_schema({
+        "type": "object",
+        "properties": {
+            "brand_mission": {"type": "string"},
+            "brand_values": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["brand_mission", "brand_values"]
+    })
+    
+    valid = check({"brand_mission": "Capture moments", "brand_values": ["Trust"]})
+    drifted = check({"brand_values": ["Trust", 3]})
+    print(f"📊 Drifted response problems: {drifted}")
+    return (
+        valid == [] and
+        drifted == ["response.brand_mission is missing", "response.brand_values[] should be string, got int"] and
+        check([]) == ["response should be object, got list"]
+    )
+
+
+def test_social_links():
+    """Test that social media links are found with or without a scheme"""
+    print("\n🔗 Testing social link detection...")
+    
+    from tools.brand_builder.step_01_website_extractor import _link_contacts
+    
+    hrefs = [
+        'https://www.linkedin.com/company/x',
+        'linkedin.com/company/y',
+        'www.facebook.com/z',
+        '//instagram.com/w',
+        '/about',
+        'https://notlinkedin.com/company/x',
+    ]
+    contacts = _link_contacts(hrefs)
+    print(f"📊 Found: {contacts}")
+    return contacts == [f"Social media found: {href}" for href in hrefs[:4]]
+
+
+def test_batch_voice_guidelines_saves():
+    """Test that a batch of Step 2 runs saves its Voice Guidelines records in one flush"""
+    print("\n📦 Testing batched Voice Guidelines saves...")
+    
+    import asyncio
+    from tools.brand_builder import step_02_brand_analyzer as step_02
+    
+    flushes = []
+    
+    def fake_save_many(records):
+        flushes.append([client_name for client_name, _ in records])
+        return [client_name != 'Beta' for client_name, _ in records]
+    
+    def unexpected_save(client_name, analysis):
+        raise AssertionError("batch runs must not save one record at a time")
+    
+    # Every output field is supplied, so skip_llm_if_possible avoids Gemini
+    supplied = {field: 'x' for field in step_02.BrandAnalysis._fields}
+    contexts = [
+        WorkflowContext({'client_name': name, 'skip_llm_if_possible': True, **supplied})
+        for name in ('Alpha', 'Beta')
+    ]
+    
+    originals = step_02.save_many_to_voice_guidelines_database, step_02.save_to_voice_guidelines_database
+    step_02.save_many_to_voice_guidelines_database = fake_save_many
+    step_02.save_to_voice_guidelines_database = unexpected_save
+    try:
+        results = asyncio.run(step_02.BrandAnalyzerTool().execute_many_async(contexts))
+    finally:
+        step_02.save_many_to_voice_guidelines_database, step_02.save_to_voice_guidelines_database = originals
+    
+    print(f"📊 Flushes: {flushes}")
+    return (
+        flushes == [['Alpha', 'Beta']] and
+        all(result.success for result in results) and
+        step_02._SAVE_FAILED_WARNING not in results[0].warnings and
+        step_02._SAVE_FAILED_WARNING in results[1].warnings
+    )
+
+
+def test_stream_array_items():
+    """Test that streamed array elements are yielded as soon as they complete"""
+    print("\n🌊 Testing incremental array parsing...")
+    
+    response = '{"content_samples": [{"channel": "Email", "notes": "a ] b"}, {"channel": "Blog"}], "total": 2}'
+    chunks = [response[i:i + 7] for i in range(0, len(response), 7)]
+    parts = []
+    items = list(iter_array_items(chunks, 'content_samples', parts))
+    
+    print(f"📊 Streamed items: {items}")
+    return (
+        items == [{"channel": "Email", "notes": "a ] b"}, {"channel": "Blog"}] and
+        ''.join(parts) == response
+    )
+
+
 def test_cli_interface():
     """Test CLI interface for individual steps"""
     print("\n💻 Testing CLI interface...")
@@ -107,6 +452,10 @@ def test_cli_interface():
         
         if result.returncode == 0:
             print("✅ CLI interface working!")
+            if os.path.exists('/tmp/test_step1.json'):
+                with open('/tmp/test_step1.json', 'rb') as f:
+                    output_data = orjson.loads(f.read())
+                print(f"📊 CLI output contains {len(output_data)} fields")
             return True
         else:
             print(f"❌ CLI failed: {result.stderr}")
@@ -127,6 +476,20 @@ def main():
         ("Individual Step", test_individual_step),
         ("Dependencies", test_step_dependencies),
         ("Multi-Step Workflow", test_workflow_execution),
+        ("Step Cache", test_step_cache),
+        ("Cache Opt-Out", test_cache_opt_out),
+        ("Broken Responses Not Cached", test_response_cache_skips_broken_json),
+        ("Expired Rows Purged", test_expired_rows_purged),
+        ("Memory Cache", test_memory_cache),
+        ("Context Serialization", test_context_serialization),
+        ("Slotted Containers", test_slotted_containers),
+        ("Fatal Errors", test_fatal_errors),
+        ("Checkpoint Resume", test_checkpoint_resume),
+        ("Parallel Steps", test_parallel_steps),
+        ("Schema Check", test_schema_check),
+        ("Social Links", test_social_links),
+        ("Batched Voice Guidelines Saves", test_batch_voice_guidelines_saves),
+        ("Stream Array Items", test_stream_array_items),
         ("CLI Interface", test_cli_interface)
     ]
     
@@ -139,23 +502,24 @@ def main():
             print(f"❌ {test_name} test crashed: {e}")
             results.append((test_name, False))
     
-    print("\n" + "=" * 60)
-    print("🎯 TEST RESULTS:")
+    # Build the summary block and emit it in a single write
+    log = ["\n" + "=" * 60, "🎯 TEST RESULTS:"]
     
     passed = 0
     for test_name, result in results:
         status = "✅ PASS" if result else "❌ FAIL"
-        print(f"  {status}: {test_name}")
+        log.append(f"  {status}: {test_name}")
         if result:
             passed += 1
     
-    print(f"\n🏆 {passed}/{len(results)} tests passed")
+    log.append(f"\n🏆 {passed}/{len(results)} tests passed")
     
     if passed == len(results):
-        print("🎉 All tests passed! Modular workflow system is ready!")
+        log.append("🎉 All tests passed! Modular workflow system is ready!")
     else:
-        print("⚠️  Some tests failed. Review issues before proceeding.")
+        log.append("⚠️  Some tests failed. Review issues before proceeding.")
     
+    sys.stdout.write("\n".join(log) + "\n")
     return passed == len(results)
 
 
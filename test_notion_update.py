@@ -8,9 +8,6 @@ import os
 import sys
 from datetime import datetime
 
-# Add the project directory to the path
-sys.path.append('/Users/jonathanedwards/jons-ai-tools')
-
 # Mock Streamlit secrets for testing
 class MockSecrets:
     def __init__(self):
@@ -113,34 +110,39 @@ def test_update_client_profile(db_manager, client_page_id):
     }
     
     try:
-        # Perform the update
-        success = db_manager.update_client_profile(client_page_id, test_data)
+        # Perform the update - the updated page comes back in the response
+        success, updated_profile = db_manager.update_client_profile(
+            client_page_id, test_data, return_profile=True
+        )
         
         if success:
             print("✅ Client profile updated successfully")
             
-            # Verify the update by retrieving the profile again
+            # Verify the update against the page returned by the update call
             print("🔍 Verifying update...")
-            updated_profile = db_manager.get_client_profile(client_page_id)
             
-            verification_success = True
-            for field, expected_value in test_data.items():
-                if field in updated_profile:
-                    actual_value = updated_profile[field]
-                    if isinstance(actual_value, list):
-                        actual_value = ", ".join(actual_value)
-                    
-                    if actual_value == expected_value:
-                        print(f"  ✅ {field}: Update verified")
-                    else:
-                        print(f"  ❌ {field}: Expected '{expected_value}', got '{actual_value}'")
-                        verification_success = False
-                else:
+            # Normalize list fields once, then collect every mismatch in one pass
+            normalized = {
+                field: ", ".join(value) if isinstance(value, list) else value
+                for field, value in updated_profile.items()
+                if field in test_data
+            }
+            mismatches = {
+                field: (expected_value, normalized.get(field))
+                for field, expected_value in test_data.items()
+                if normalized.get(field) != expected_value
+            }
+            verification_success = not mismatches
+            
+            # Only the failures need per-field reporting
+            for field, (expected_value, actual_value) in mismatches.items():
+                if actual_value is None:
                     print(f"  ❌ {field}: Field not found in updated profile")
-                    verification_success = False
+                else:
+                    print(f"  ❌ {field}: Expected '{expected_value}', got '{actual_value}'")
             
             if verification_success:
-                print("✅ All updates verified successfully")
+                print(f"✅ All {len(test_data)} updates verified successfully")
             else:
                 print("⚠️ Some updates could not be verified")
                 
@@ -168,12 +170,14 @@ def main():
             missing_vars.append(var)
     
     if missing_vars:
-        print(f"❌ Missing environment variables: {', '.join(missing_vars)}")
-        print("\n💡 To run this test, set the following environment variables:")
-        print("   export NOTION_API_KEY='your_notion_api_key'")
-        print("   export NOTION_DATABASE_ID='your_database_id'")
-        print("\n   Or run with variables inline:")
-        print("   NOTION_API_KEY='xxx' NOTION_DATABASE_ID='xxx' python test_notion_update.py")
+        sys.stdout.write("\n".join([
+            f"❌ Missing environment variables: {', '.join(missing_vars)}",
+            "\n💡 To run this test, set the following environment variables:",
+            "   export NOTION_API_KEY='your_notion_api_key'",
+            "   export NOTION_DATABASE_ID='your_database_id'",
+            "\n   Or run with variables inline:",
+            "   NOTION_API_KEY='xxx' NOTION_DATABASE_ID='xxx' python test_notion_update.py",
+        ]) + "\n")
         return False
     else:
         print("✅ Environment variables configured")
@@ -197,11 +201,11 @@ def main():
     # Test 4: Update client profile
     update_success = test_update_client_profile(db_manager, client_page_id)
     
-    print("\n" + "=" * 50)
     if update_success:
-        print("🎉 ALL TESTS PASSED! Notion database updates are working correctly.")
+        summary = "🎉 ALL TESTS PASSED! Notion database updates are working correctly."
     else:
-        print("❌ TESTS FAILED! There are issues with Notion database updates.")
+        summary = "❌ TESTS FAILED! There are issues with Notion database updates."
+    sys.stdout.write("\n" + "=" * 50 + "\n" + summary + "\n")
     
     return update_success
 
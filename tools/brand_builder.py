@@ -19,17 +19,26 @@ Each step can be run independently for testing and debugging.
 """
 
 # Import the modular workflow system
+# NOTE: Step tools are imported inside the functions that use them so that
+# importing this module does not pull in every step's dependencies
 from tools.brand_builder import BrandBuilderWorkflow, WorkflowContext
 
-# Import individual step tools for backward compatibility
-from tools.brand_builder.step_01_website_extractor import WebsiteExtractorTool
-from tools.brand_builder.step_02_brand_analyzer import BrandAnalyzerTool
+# How step output values are flattened into Notion profile fields, by exact type
+_NOTION_COERCE = {
+    list: lambda v: ', '.join(map(str, v)),
+    str: lambda v: v,
+    int: str,
+    float: str,
+    bool: str,
+}
 
 
 def extract_website_data(client_name, website_url):
     """
     Step 1: Extract website data (backward compatibility function)
     """
+    from tools.brand_builder.step_01_website_extractor import WebsiteExtractorTool
+    
     context = WorkflowContext({
         'client_name': client_name,
         'website_url': website_url
@@ -45,11 +54,9 @@ def analyze_brand_voice(client_name, website_data, form_data=None):
     """
     Step 2: Analyze brand voice (backward compatibility function)
     """
-    context_data = {'client_name': client_name}
-    context_data.update(website_data or {})
-    context_data.update(form_data or {})
+    from tools.brand_builder.step_02_brand_analyzer import BrandAnalyzerTool
     
-    context = WorkflowContext(context_data)
+    context = WorkflowContext({'client_name': client_name, **(website_data or {}), **(form_data or {})})
     
     step = BrandAnalyzerTool()
     result = step.execute(context)
@@ -57,22 +64,30 @@ def analyze_brand_voice(client_name, website_data, form_data=None):
     return result.success, result.data, result.errors[0] if result.errors else None
 
 
+def _build_analysis_context(client_name, industry, website_url=None, form_data=None):
+    """Build the workflow context shared by the sync and async analysis entry points"""
+    return WorkflowContext({
+        'client_name': client_name,
+        'industry': industry,
+        **({'website_url': website_url} if website_url else {}),
+        **(form_data or {})
+    })
+
+
+def _analysis_outcome(context, results):
+    """Convert workflow results into the legacy (success, data, error) tuple"""
+    if results and results[-1].success:
+        return True, dict(context.data), None
+    else:
+        errors = [r.errors[0] for r in results if r.errors]
+        return False, {}, '; '.join(errors) if errors else "Unknown error"
+
+
 def comprehensive_client_analysis(client_name, industry, website_url=None, form_data=None, optimize_content=True):
     """
     Two-step analysis process using modular system
     """
-    context_data = {
-        'client_name': client_name,
-        'industry': industry
-    }
-    
-    if website_url:
-        context_data['website_url'] = website_url
-    
-    if form_data:
-        context_data.update(form_data)
-    
-    context = WorkflowContext(context_data)
+    context = _build_analysis_context(client_name, industry, website_url, form_data)
     workflow = BrandBuilderWorkflow()
     
     # Run steps 1-2
@@ -81,11 +96,24 @@ def comprehensive_client_analysis(client_name, industry, website_url=None, form_
     else:
         results = workflow.run_workflow(context, start_from=2, end_at=2)
     
-    if results and results[-1].success:
-        return True, context.data, None
-    else:
-        errors = [r.errors[0] for r in results if r.errors]
-        return False, {}, '; '.join(errors) if errors else "Unknown error"
+    return _analysis_outcome(context, results)
+
+
+async def comprehensive_client_analysis_async(client_name, industry, website_url=None, form_data=None, optimize_content=True):
+    """
+    Async variant of comprehensive_client_analysis
+    
+    Step 2 consumes Step 1's extracted fields, so the two steps still run in
+    order for a single client. Awaiting this coroutine for several clients
+    (e.g. with asyncio.gather) overlaps their website fetches and LLM calls.
+    """
+    context = _build_analysis_context(client_name, industry, website_url, form_data)
+    workflow = BrandBuilderWorkflow()
+    
+    start_from = 1 if website_url else 2
+    results = await workflow.run_workflow_async(context, start_from=start_from, end_at=2)
+    
+    return _analysis_outcome(context, results)
 
 
 def run_brand_builder():
@@ -94,13 +122,15 @@ def run_brand_builder():
     """
     import streamlit as st
     from frameworks import research_tools_framework
+    from tools.brand_builder.step_01_website_extractor import WebsiteExtractorTool
+    from tools.brand_builder.step_02_brand_analyzer import BrandAnalyzerTool
     
     st.title("Brand Builder")
     st.write("Build comprehensive brand profiles using modular workflow system")
     
     # Initialize database manager
     try:
-        db_manager = research_tools_framework.NotionDatabaseManager()
+        db_manager = research_tools_framework.get_db_manager()
     except Exception as e:
         st.error("🔧 **Configuration Required**")
         st.error("Please configure your Notion API credentials.")
@@ -118,7 +148,7 @@ def run_brand_builder():
         return
     
     # Get client profile
-    client_profile = db_manager.get_client_profile(client_page_id)
+    client_profile = research_tools_framework.get_cached_client_profile(client_page_id)
     
     st.subheader(f"Working on: {selected_client}")
     
@@ -140,6 +170,7 @@ def run_brand_builder():
                     st.json(result.data)
                     # Save to Notion
                     db_manager.update_client_profile(client_page_id, result.data)
+                    research_tools_framework.get_cached_client_profile.clear()
                 else:
                     st.error("❌ Step 1 failed!")
                     for error in result.errors:
@@ -147,9 +178,7 @@ def run_brand_builder():
         
         if st.button("Run Step 2: Brand Analyzer"):
             step_tool = BrandAnalyzerTool()
-            context_data = {'client_name': selected_client}
-            context_data.update(client_profile)
-            context = WorkflowContext(context_data)
+            context = WorkflowContext({'client_name': selected_client, **client_profile})
             result = step_tool.execute(context)
             
             if result.success:
@@ -163,6 +192,7 @@ def run_brand_builder():
                     "Brand_Mission": result.data.get("brand_mission", ""),
                 }
                 db_manager.update_client_profile(client_page_id, notion_data)
+                research_tools_framework.get_cached_client_profile.clear()
             else:
                 st.error("❌ Step 2 failed!")
                 for error in result.errors:
@@ -173,12 +203,12 @@ def run_brand_builder():
         
         if st.button("Run Complete Brand Builder Workflow"):
             # Create workflow context from client profile
-            context_data = {'client_name': selected_client}
-            context_data.update(client_profile)
-            if client_profile.get("Website"):
-                context_data['website_url'] = client_profile["Website"]
-            
-            context = WorkflowContext(context_data)
+            website = client_profile.get("Website")
+            context = WorkflowContext({
+                'client_name': selected_client,
+                **client_profile,
+                **({'website_url': website} if website else {})
+            })
             workflow = BrandBuilderWorkflow()
             
             # Run the workflow
@@ -186,11 +216,12 @@ def run_brand_builder():
                 results = workflow.run_workflow(context, start_from=1, end_at=9)
             
             # Show results
-            success_count = sum(1 for r in results if r.success)
+            successes = [r.success for r in results]
+            success_count = successes.count(True)
             st.write(f"Completed {success_count}/{len(results)} steps")
             
-            for i, result in enumerate(results, 1):
-                if result.success:
+            for i, (result, succeeded) in enumerate(zip(results, successes), 1):
+                if succeeded:
                     st.success(f"✅ Step {i}: {result.step_name}")
                 else:
                     st.error(f"❌ Step {i}: {result.step_name}")
@@ -198,16 +229,20 @@ def run_brand_builder():
                         st.error(f"  {error}")
             
             if success_count > 0:
-                st.success("Workflow completed! Data saved to Notion.")
-                # Save final context to Notion
-                notion_data = {}
-                for key, value in context.data.items():
-                    if isinstance(value, list):
-                        notion_data[key] = ', '.join(value)
-                    elif isinstance(value, str):
-                        notion_data[key] = value
+                # Buffer each completed step's output and flush them in one write
+                pending_writes = [
+                    {
+                        key: _NOTION_COERCE[type(value)](value)
+                        for key, value in result.data.items()
+                        if type(value) in _NOTION_COERCE
+                    }
+                    for result in results if result.success
+                ]
                 
-                db_manager.update_client_profile(client_page_id, notion_data)
+                with st.spinner("Saving..."):
+                    db_manager.update_client_profile_batch(client_page_id, pending_writes)
+                research_tools_framework.get_cached_client_profile.clear()
+                st.success("Workflow completed! Data saved to Notion.")
 
 
 # Export the main functions for backward compatibility
@@ -215,6 +250,7 @@ __all__ = [
     'extract_website_data',
     'analyze_brand_voice', 
     'comprehensive_client_analysis',
+    'comprehensive_client_analysis_async',
     'run_brand_builder',
     'BrandBuilderWorkflow',
     'WorkflowContext'
@@ -7,21 +7,37 @@ in isolation while maintaining the ability to run as a complete workflow.
 
 Architecture:
 - Each step inherits from WorkflowStep base class
-- Steps are auto-discovered using importlib
+- Steps are imported lazily with importlib on first use
 - Context is passed between steps as JSON
 - Each step can be tested independently
 - Workflow can resume from any step
 """
 
+import asyncio
 import importlib
-import json
 import os
-from typing import Dict, List, Any, Optional
+import sys
+import tempfile
+import threading
+import orjson
+from collections import ChainMap
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# Steps import top-level project modules (frameworks, database_config), so
+# make the project root importable once here rather than in every step module
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
-@dataclass
+from ._cache import DEFAULT_TTL, LLMStepCache, cached_gemini_call, caching_enabled
+from ._notion import notion_client
+
+
+@dataclass(slots=True)
 class StepResult:
     """Result of executing a workflow step"""
     success: bool
@@ -30,16 +46,28 @@ class StepResult:
     warnings: List[str]
     step_name: str
     
+    @property
+    def has_fatal(self) -> bool:
+        """Whether any error is marked FATAL (read from errors, so later appends count)"""
+        return any("FATAL" in error for error in self.errors)
+    
     def can_continue(self) -> bool:
         """Determine if workflow can proceed to next step"""
-        return self.success and not any("FATAL" in error for error in self.errors)
+        return self.success and not self.has_fatal
 
 
 class WorkflowContext:
-    """Manages data flow between workflow steps"""
+    """Manages data flow between workflow steps
+    
+    data is a ChainMap: direct writes go to the top layer and each successful
+    step's output is pushed as a new layer instead of being copied into one
+    flat dict, so forks and snapshots are cheap.
+    """
+    
+    __slots__ = ('data', 'step_results')
     
     def __init__(self, initial_data: Dict = None):
-        self.data = initial_data or {}
+        self.data = ChainMap({}, initial_data or {})
         self.step_results = {}
     
     def get(self, key: str, default=None):
@@ -48,39 +76,56 @@ class WorkflowContext:
     
     def set(self, key: str, value: Any):
         """Set data in context"""
-        self.data[key] = value
+        self.data.maps[0][key] = value
     
     def update(self, data: Dict):
         """Update context with new data"""
-        self.data.update(data)
+        self.data.maps[0].update(data)
     
     def add_step_result(self, result: StepResult):
         """Add result from a completed step"""
         self.step_results[result.step_name] = result
         if result.success:
-            self.data.update(result.data)
+            # Layer the step output over earlier data, with a fresh writable layer on top
+            self.data = self.data.new_child(result.data).new_child()
+    
+    def fork(self) -> 'WorkflowContext':
+        """Cheap copy for running a step in isolation (e.g. concurrently)
+        
+        The fork shares this context's layers and writes to its own top layer,
+        so the parent must not be modified while the fork is in use.
+        """
+        forked = WorkflowContext()
+        forked.data = self.data.new_child()
+        forked.step_results = dict(self.step_results)
+        return forked
     
     def get_step_result(self, step_name: str) -> Optional[StepResult]:
         """Get result from a specific step"""
         return self.step_results.get(step_name)
     
+    def _serializable(self) -> Dict[str, Any]:
+        """The context as orjson input, with step results left as dataclasses"""
+        return {'data': dict(self.data), 'step_results': self.step_results}
+    
     def to_json(self) -> str:
-        """Serialize context to JSON"""
-        return json.dumps({
-            'data': self.data,
-            'step_results': {k: {
-                'success': v.success,
-                'data': v.data,
-                'errors': v.errors,
-                'warnings': v.warnings,
-                'step_name': v.step_name
-            } for k, v in self.step_results.items()}
-        }, indent=2)
+        """Serialize context to JSON
+        
+        orjson encodes the StepResult dataclasses natively, so no dict mirror
+        of the step results is built first. Results are encoded afresh on
+        every call: they stay mutable (warnings get appended later), so a
+        cached encoding could go stale.
+        """
+        return orjson.dumps(self._serializable(), option=orjson.OPT_INDENT_2).decode('utf-8')
     
     @classmethod
     def from_json(cls, json_str: str) -> 'WorkflowContext':
         """Deserialize context from JSON"""
-        data = json.loads(json_str)
+        return cls._from_serializable(orjson.loads(json_str))
+    
+    @classmethod
+    def _from_serializable(cls, data: Dict[str, Any]) -> 'WorkflowContext':
+        """Rebuild a context from decoded to_json output"""
         context = cls(data['data'])
         
         for step_name, result_data in data.get('step_results', {}).items():
@@ -96,6 +141,10 @@ class WorkflowContext:
         return context
 
 
+# Upper bound on concurrent executions of one step across contexts
+MAX_CONCURRENT_STEP_RUNS = 16
+
+
 class WorkflowStep(ABC):
     """Base class for all Brand Builder workflow steps"""
     
@@ -108,14 +157,96 @@ class WorkflowStep(ABC):
         """Execute this step with the given context"""
         pass
     
+    async def execute_async(self, context: WorkflowContext) -> StepResult:
+        """Execute this step without blocking the event loop
+        
+        Steps are I/O-bound (HTTP fetches, LLM calls), so the synchronous
+        execute() runs in a worker thread and other coroutines - e.g. other
+        clients' workflows - make progress while it waits on the network.
+        """
+        return await asyncio.to_thread(self.execute, context)
+    
+    async def execute_many_async(self, contexts: List[WorkflowContext],
+                                 concurrency: int = MAX_CONCURRENT_STEP_RUNS) -> List[StepResult]:
+        """Execute this step for several contexts (e.g. clients) concurrently
+        
+        At most `concurrency` executions are in flight at once, which keeps
+        the LLM calls inside the API's rate limits. Results are returned in
+        the same order as contexts.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(context):
+            async with semaphore:
+                return await self.execute_async(context)
+        
+        return list(await asyncio.gather(*(run(context) for context in contexts)))
+    
+    def run_llm_step(self, build_prompt: Callable[[WorkflowContext], Tuple[str, float]],
+                     context: WorkflowContext, failure_label: str,
+                     response_schema: Dict = None) -> StepResult:
+        """Build a prompt, call Gemini through the response cache and parse the JSON reply
+        
+        The shared body of steps whose whole job is one structured LLM call.
+        A GeminiAPIError becomes an "API call failed" error; anything
+        raised while building the prompt or parsing is reported as
+        "<failure_label> failed: ...".
+        """
+        # Imported here so the package stays importable without Streamlit
+        from frameworks import universal_framework
+        
+        try:
+            prompt, temperature = build_prompt(context)
+            try:
+                response = cached_gemini_call(
+                    universal_framework.call_gemini_api, prompt, response_schema=response_schema,
+                    temperature=temperature, model=universal_framework.GEMINI_MODEL
+                )
+            except universal_framework.GeminiAPIError as e:
+                return StepResult(
+                    success=False,
+                    data={},
+                    errors=[f"API call failed: {e}"],
+                    warnings=[],
+                    step_name=self.name
+                )
+            
+            return StepResult(
+                success=True,
+                data=orjson.loads(response),
+                errors=[],
+                warnings=[],
+                step_name=self.name
+            )
+            
+        except Exception as e:
+            return StepResult(
+                success=False,
+                data={},
+                errors=[f"{failure_label} failed: {str(e)}"],
+                warnings=[],
+                step_name=self.name
+            )
+    
+    def _class_cached(self, method_name: str) -> Tuple[str, ...]:
+        """Result of a field-list method, computed once per step class
+        
+        get_required_inputs, get_dependencies and get_output_fields return
+        constants, so the hot path reads them from a per-class cache.
+        """
+        cls = type(self)
+        cache = cls.__dict__.get('_field_cache')
+        if cache is None:
+            cache = {}
+            cls._field_cache = cache
+        if method_name not in cache:
+            cache[method_name] = tuple(getattr(self, method_name)())
+        return cache[method_name]
+    
     def validate_inputs(self, context: WorkflowContext) -> List[str]:
         """Validate required inputs exist in context. Return list of missing fields."""
-        required = self.get_required_inputs()
-        missing = []
-        for field in required:
-            if field not in context.data:
-                missing.append(field)
-        return missing
+        data = context.data
+        return [field for field in self._class_cached('get_required_inputs') if field not in data]
     
     def get_required_inputs(self) -> List[str]:
         """Return list of required input fields for this step"""
@@ -130,52 +261,80 @@ class WorkflowStep(ABC):
         return []
 
 
+# Step number -> module slug; modules are imported on first use and
+# expose their WorkflowStep subclass as STEP_CLASS
+STEP_SLUGS = {
+    1: 'website_extractor',
+    2: 'brand_analyzer',
+    3: 'content_collector',
+    4: 'voice_auditor',
+    5: 'audience_definer',
+    6: 'voice_traits_builder',
+    7: 'gap_analyzer',
+    8: 'content_rewriter',
+    9: 'guidelines_finalizer',
+}
+
+
 class BrandBuilderWorkflow:
     """Main orchestrator for Brand Builder workflow"""
     
-    def __init__(self):
+    def __init__(self, cache_enabled: bool = True, cache_ttl: int = None):
         self.steps = {}
-        self.step_order = []
-        self._discover_steps()
-    
-    def _discover_steps(self):
-        """Discover all available workflow steps"""
-        # Import all step modules to register them
-        step_modules = [
-            'step_01_website_extractor',
-            'step_02_brand_analyzer', 
-            'step_03_content_collector',
-            'step_04_voice_auditor',
-            'step_05_audience_definer',
-            'step_06_voice_traits_builder',
-            'step_07_gap_analyzer',
-            'step_08_content_rewriter',
-            'step_09_guidelines_finalizer'
-        ]
-        
-        for module_name in step_modules:
-            try:
-                module = importlib.import_module(f'tools.brand_builder.{module_name}')
-                # Find the step class in the module
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (isinstance(attr, type) and 
-                        issubclass(attr, WorkflowStep) and 
-                        attr != WorkflowStep):
-                        
-                        step_instance = attr()
-                        step_num = int(module_name.split('_')[1])  # Extract step number
-                        self.steps[step_num] = step_instance
-                        
-            except ImportError as e:
-                print(f"Warning: Could not import {module_name}: {e}")
-        
-        # Order steps by number
-        self.step_order = sorted(self.steps.keys())
+        self._module_names = {num: f'step_{num:02d}_{slug}' for num, slug in STEP_SLUGS.items()}
+        self._unavailable = set()
+        self._set_step_order(self._module_names)
+        self.cache_enabled = cache_enabled and caching_enabled()
+        self._cache = LLMStepCache(ttl=cache_ttl or DEFAULT_TTL) if self.cache_enabled else None
+    
+    def _set_step_order(self, step_numbers):
+        """Freeze the sorted step numbers and remember the last one"""
+        self.step_order = tuple(sorted(step_numbers))
+        self._step_descriptions = None
+        self._status_cache = None
+        self._max_step = self.step_order[-1] if self.step_order else 0
+    
+    def clear_cache(self):
+        """Drop all cached step results"""
+        if self._cache is not None:
+            self._cache.clear()
+    
+    def _cache_key(self, step: WorkflowStep, context: WorkflowContext) -> Optional[str]:
+        """Cache key for the full context a step runs on, or None when caching doesn't apply"""
+        if not self.cache_enabled:
+            return None
+        # Steps read optional fields (industry, prior outputs...) beyond their
+        # required inputs, so every field has to be part of the key
+        return LLMStepCache.make_key(step.name, dict(context.data))
+    
+    def _load_step(self, step_number: int) -> Optional[WorkflowStep]:
+        """Import a step's module on first use and cache its instance"""
+        if step_number in self.steps:
+            return self.steps[step_number]
+        
+        module_name = self._module_names.get(step_number)
+        if module_name is None or step_number in self._unavailable:
+            return None
+        
+        try:
+            module = importlib.import_module(f'tools.brand_builder.{module_name}')
+        except ImportError as e:
+            print(f"Warning: Could not import {module_name}: {e}")
+            self._unavailable.add(step_number)
+            return None
+        
+        step_cls = getattr(module, 'STEP_CLASS', None)
+        if step_cls is None:
+            self._unavailable.add(step_number)
+            return None
+        
+        self.steps[step_number] = step_cls()
+        return self.steps[step_number]
     
     def run_step(self, step_number: int, context: WorkflowContext) -> StepResult:
         """Run a specific step"""
-        if step_number not in self.steps:
+        step = self._load_step(step_number)
+        if step is None:
             return StepResult(
                 success=False,
                 data={},
@@ -184,8 +343,6 @@ class BrandBuilderWorkflow:
                 step_name=f"step_{step_number:02d}"
             )
         
-        step = self.steps[step_number]
-        
         # Validate inputs
         missing_inputs = step.validate_inputs(context)
         if missing_inputs:
@@ -197,10 +354,34 @@ class BrandBuilderWorkflow:
                 step_name=step.name
             )
         
+        # Skip steps whose outputs are already present (e.g. resumed or loaded from Notion)
+        outputs = step._class_cached('get_output_fields')
+        if outputs and all(field in context.data for field in outputs):
+            result = StepResult(
+                success=True,
+                data={field: context.data[field] for field in outputs},
+                errors=[],
+                warnings=['skipped: outputs present'],
+                step_name=step.name
+            )
+            context.add_step_result(result)
+            return result
+        
+        # Reuse a cached result for identical inputs
+        cache_key = self._cache_key(step, context)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                result = StepResult(**cached)
+                context.add_step_result(result)
+                return result
+        
         # Execute step
         try:
             result = step.execute(context)
             context.add_step_result(result)
+            if cache_key is not None and result.success:
+                self._cache.set(cache_key, result)
             return result
         except Exception as e:
             return StepResult(
@@ -211,85 +392,261 @@ class BrandBuilderWorkflow:
                 step_name=step.name
             )
     
-    def run_workflow(self, context: WorkflowContext, start_from: int = 1, end_at: int = None) -> List[StepResult]:
-        """Run the complete workflow or a subset"""
-        results = []
-        end_step = end_at or max(self.step_order)
+    def _build_dag(self, step_numbers: List[int]) -> Dict[int, Set[int]]:
+        """Map each given step number to the step numbers it depends on"""
+        dag = {}
+        for step_num in step_numbers:
+            step = self._load_step(step_num)
+            dependencies = step._class_cached('get_dependencies') if step else ()
+            dag[step_num] = {int(dep.split('_')[1]) for dep in dependencies}
+        return dag
+    
+    @staticmethod
+    def _save_checkpoint(checkpoint_path: Path, context: WorkflowContext, next_step: int):
+        """Atomically write the context and the step to resume from"""
+        checkpoint_path = Path(checkpoint_path)
+        # The context is embedded as an object (not a to_json string) so the
+        # indented file is actually readable
+        payload = orjson.dumps(
+            {'next_step': next_step, 'context': context._serializable()}, option=orjson.OPT_INDENT_2
+        )
+        with tempfile.NamedTemporaryFile(dir=checkpoint_path.parent, delete=False) as tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, checkpoint_path)
+    
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: Path, context: WorkflowContext) -> Optional[int]:
+        """Restore a saved context into the given one and return the step to resume from"""
+        checkpoint_path = Path(checkpoint_path)
+        if not checkpoint_path.exists():
+            return None
         
-        for step_num in self.step_order:
-            if step_num < start_from:
-                continue
-            if step_num > end_step:
-                break
+        checkpoint = orjson.loads(checkpoint_path.read_bytes())
+        restored = WorkflowContext._from_serializable(checkpoint['context'])
+        context.data = restored.data
+        context.step_results = restored.step_results
+        return checkpoint['next_step']
+    
+    def run_workflow(self, context: WorkflowContext, start_from: int = 1, end_at: int = None,
+                     checkpoint_path: Optional[Path] = None) -> List[StepResult]:
+        """Run the complete workflow or a subset
+        
+        Steps are scheduled in waves from their declared dependencies: every
+        step whose dependencies have completed runs concurrently in a thread
+        pool against its own fork of the context, and successful results are
+        merged back before the next wave. A wave with a single ready step runs
+        inline in the calling thread. Dependencies outside the requested range
+        are expected to already be satisfied by the context.
+        
+        With checkpoint_path, the context is saved after each successful step
+        (or wave) and an existing checkpoint replaces the given context's data
+        and results, resuming after the last saved step. The checkpoint is
+        removed once the requested range completes.
+        """
+        end_step = end_at or self._max_step
+        if checkpoint_path is not None:
+            next_step = self._load_checkpoint(checkpoint_path, context)
+            if next_step is not None:
+                start_from = max(start_from, next_step)
+        
+        selected = [step_num for step_num in self.step_order if start_from <= step_num <= end_step]
+        dag = self._build_dag(selected)
+        known_steps = self._module_names.keys() | self.steps.keys()
+        
+        # Fall back to strict step order if a dependency points at a step we don't have
+        if any(not dag[step_num] <= known_steps for step_num in selected):
+            results = self._run_sequential(context, selected, checkpoint_path)
+            self._finish_checkpoint(checkpoint_path, results, selected)
+            return results
+        
+        results = {}
+        remaining = set(selected)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(selected)))) as executor:
+            while remaining:
+                ready = [step_num for step_num in sorted(remaining) if not dag[step_num] & remaining]
+                if not ready:
+                    # Dependency cycle - run whatever is left in step order
+                    leftover = sorted(remaining)
+                    results.update(zip(leftover, self._run_sequential(context, leftover, checkpoint_path)))
+                    break
+                remaining.difference_update(ready)
+                
+                if len(ready) == 1:
+                    wave = [(ready[0], self.run_step(ready[0], context))]
+                else:
+                    forks = {step_num: context.fork() for step_num in ready}
+                    futures = {
+                        step_num: executor.submit(self.run_step, step_num, fork)
+                        for step_num, fork in forks.items()
+                    }
+                    wave = [(step_num, futures[step_num].result()) for step_num in ready]
+                    for step_num, result in wave:
+                        # Only merge results the step actually recorded in its fork
+                        if forks[step_num].get_step_result(result.step_name) is result:
+                            context.add_step_result(result)
+                
+                results.update(wave)
+                
+                failed = [step_num for step_num, result in wave if not result.can_continue()]
+                if failed:
+                    print(f"Workflow stopped at step {failed[0]} due to errors")
+                    break
                 
+                if checkpoint_path is not None:
+                    self._save_checkpoint(checkpoint_path, context, min(remaining, default=end_step + 1))
+        
+        ordered = [results[step_num] for step_num in sorted(results)]
+        self._finish_checkpoint(checkpoint_path, ordered, selected)
+        return ordered
+    
+    @staticmethod
+    def _finish_checkpoint(checkpoint_path: Optional[Path], results: List[StepResult], selected: List[int]):
+        """Remove the checkpoint once every requested step has completed"""
+        if checkpoint_path is None:
+            return
+        if len(results) == len(selected) and all(result.can_continue() for result in results):
+            Path(checkpoint_path).unlink(missing_ok=True)
+    
+    def _run_sequential(self, context: WorkflowContext, step_numbers: List[int],
+                        checkpoint_path: Optional[Path] = None) -> List[StepResult]:
+        """Run the given steps one after another, stopping at the first failure"""
+        results = []
+        
+        for step_num in step_numbers:
             result = self.run_step(step_num, context)
             results.append(result)
             
             if not result.can_continue():
                 print(f"Workflow stopped at step {step_num} due to errors")
                 break
+            
+            if checkpoint_path is not None:
+                self._save_checkpoint(checkpoint_path, context, step_num + 1)
         
         return results
     
+    async def run_workflow_async(self, context: WorkflowContext, start_from: int = 1, end_at: int = None,
+                                 checkpoint_path: Optional[Path] = None) -> List[StepResult]:
+        """Run the workflow without blocking the event loop
+        
+        Dependent steps still run in order within one context; the benefit is
+        that several contexts (clients) can be processed concurrently.
+        """
+        return await asyncio.to_thread(self.run_workflow, context, start_from, end_at, checkpoint_path)
+    
     def get_step_status(self, context: WorkflowContext) -> Dict[int, str]:
-        """Get status of all steps"""
+        """Get status of all steps
+        
+        Status only depends on which fields are present and which steps have
+        succeeded, so the last answer is reused until that shape changes.
+        """
+        key = (
+            frozenset(context.data.keys()),
+            tuple(sorted((name, result.success) for name, result in context.step_results.items()))
+        )
+        if self._status_cache is not None and self._status_cache[0] == key:
+            return dict(self._status_cache[1])
+        
         status = {}
         for step_num in self.step_order:
-            step = self.steps[step_num]
+            step = self._load_step(step_num)
+            if step is None:
+                continue
             if step.name in context.step_results:
                 result = context.step_results[step.name]
                 status[step_num] = "completed" if result.success else "failed"
             else:
                 missing_inputs = step.validate_inputs(context)
                 status[step_num] = "ready" if not missing_inputs else "blocked"
-        return status
+        self._status_cache = (key, status)
+        return dict(status)
     
     def list_steps(self) -> Dict[int, str]:
-        """List all available steps"""
-        return {num: self.steps[num].description for num in self.step_order}
+        """List all available steps, importing any not yet loaded"""
+        if self._step_descriptions is None:
+            self._step_descriptions = {
+                num: step.description
+                for num in self.step_order
+                if (step := self._load_step(num)) is not None
+            }
+        return dict(self._step_descriptions)
+
 
+# Main classes; __all__ itself is computed on first use (see __getattr__) so
+# it can list only the compatibility functions that actually load
+_EXPORTS = ['WorkflowStep', 'WorkflowContext', 'StepResult', 'BrandBuilderWorkflow']
 
-# Export main classes and backward compatibility functions
-__all__ = ['WorkflowStep', 'WorkflowContext', 'StepResult', 'BrandBuilderWorkflow']
+# Backward compatibility functions live in tools/brand_builder.py, which this
+# package shadows on the import path. They are loaded from that file on first
+# attribute access (PEP 562) rather than at package import.
+_COMPAT_FUNCTIONS = (
+    'extract_website_data',
+    'analyze_brand_voice',
+    'comprehensive_client_analysis',
+    'comprehensive_client_analysis_async',
+    'run_brand_builder',
+)
+
+_compat_module = None
+_compat_attempted = False
+
+
+def _import_compat_module():
+    """Load tools/brand_builder.py once; None if it can't be imported (e.g. without Streamlit)"""
+    global _compat_module, _compat_attempted
+    if not _compat_attempted:
+        _compat_attempted = True
+        try:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location(
+                "brand_builder_main",
+                os.path.join(os.path.dirname(os.path.dirname(__file__)), "brand_builder.py")
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _compat_module = module
+        except Exception:
+            _compat_module = None
+    return _compat_module
 
-# Import backward compatibility functions from the main module
-def _import_compat_functions():
-    """Import compatibility functions from the main brand_builder.py"""
-    import sys
-    import os
+
+def _compat_function(name):
+    """A compatibility function, or None if it isn't available"""
+    module = _import_compat_module()
+    return getattr(module, name, None) if module is not None else None
+
+
+def __getattr__(name):
+    if name == '__all__':
+        return _EXPORTS + [name for name in _COMPAT_FUNCTIONS if _compat_function(name) is not None]
+    if name in _COMPAT_FUNCTIONS:
+        function = _compat_function(name)
+        if function is not None:
+            return function
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _warm_up_connections():
+    """Open the Notion and Gemini connections before the first step needs them
     
-    # Add the tools directory to path to import brand_builder.py directly
-    tools_dir = os.path.dirname(os.path.dirname(__file__))
-    if tools_dir not in sys.path:
-        sys.path.insert(0, tools_dir)
+    Runs in a background thread; a failed warm-up just leaves the first real
+    request to pay for DNS, TCP and TLS setup as before.
+    """
+    try:
+        from database_config import NOTION_API_KEY
+        if NOTION_API_KEY:
+            notion_client(NOTION_API_KEY).users.me()
+    except Exception:
+        pass
     
     try:
-        # Import from brand_builder.py file directly
-        import importlib.util
-        spec = importlib.util.spec_from_file_location(
-            "brand_builder_main", 
-            os.path.join(tools_dir, "brand_builder.py")
-        )
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            return module
+        from frameworks import universal_framework
+        universal_framework.warm_up_gemini()
     except Exception:
-        return None
+        pass
+
 
-# Try to import and expose compatibility functions
-_compat_module = _import_compat_functions()
-if _compat_module:
-    extract_website_data = getattr(_compat_module, 'extract_website_data', None)
-    analyze_brand_voice = getattr(_compat_module, 'analyze_brand_voice', None)
-    comprehensive_client_analysis = getattr(_compat_module, 'comprehensive_client_analysis', None)
-    run_brand_builder = getattr(_compat_module, 'run_brand_builder', None)
-    
-    if extract_website_data:
-        __all__.append('extract_website_data')
-    if analyze_brand_voice:
-        __all__.append('analyze_brand_voice')
-    if comprehensive_client_analysis:
-        __all__.append('comprehensive_client_analysis')
-    if run_brand_builder:
-        __all__.append('run_brand_builder')
\ No newline at end of file
+# Opt-in, since it makes network requests as a side effect of importing the package
+if os.environ.get('BRAND_BUILDER_WARMUP', '').lower() in ('1', 'true', 'yes'):
+    threading.Thread(target=_warm_up_connections, name='brand-builder-warmup', daemon=True).start()
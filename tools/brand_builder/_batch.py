@@ -0,0 +1,55 @@
+"""
+Batch runs of a single step from its CLI
+
+A step's --input-glob option runs it for every matching input file (e.g. one
+per client) concurrently in one process, through execute_many_async, so the
+LLM calls overlap instead of running one CLI invocation after another.
+"""
+
+import asyncio
+import glob
+import os
+
+import orjson
+
+from tools.brand_builder import WorkflowContext, WorkflowStep
+
+
+def run_batch(step: WorkflowStep, input_glob: str, client_name: str, output_dir: str = None) -> None:
+    """
+    Run a step for every JSON file matching input_glob and report each result
+
+    Args:
+        step: Step to run
+        input_glob: Glob of input JSON files, e.g. "step1_outputs/*.json"
+        client_name: Client name for files that don't set one
+        output_dir: Directory to write each successful result to, under its input's file name
+    """
+    paths = sorted(glob.glob(input_glob))
+    if not paths:
+        print(f"❌ No input files match {input_glob}")
+        return
+
+    contexts = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            contexts.append(WorkflowContext({'client_name': client_name, **orjson.loads(f.read())}))
+
+    # Gemini calls are I/O bound, so threads (bounded by the step's
+    # concurrency limit) share one interpreter, Notion client and cache
+    print(f"🚀 Running {step.name} for {len(paths)} inputs...")
+    results = asyncio.run(step.execute_many_async(contexts))
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    for path, result in zip(paths, results):
+        name = os.path.basename(path)
+        if not result.success:
+            print(f"❌ {name}: {'; '.join(result.errors)}")
+        elif output_dir:
+            output_path = os.path.join(output_dir, name)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(result.data, option=orjson.OPT_INDENT_2))
+            print(f"✅ {name}: saved to {output_path}")
+        else:
+            print(f"✅ {name}: generated {len(result.data)} fields")
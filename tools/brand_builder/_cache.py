@@ -0,0 +1,280 @@
+"""
+Persistent caches for workflow step results and LLM responses
+
+Steps build deterministic LLM prompts from the workflow context, so a step
+re-run on the same context (e.g. on a Streamlit rerun) can reuse the earlier
+StepResult instead of calling the model again. Results are stored in a local
+SQLite database keyed on a SHA-256 of the step name and the context data.
+
+Individual Gemini calls are cached the same way, keyed on the prompt, response
+schema, temperature and model, with a small in-process tier in front of SQLite.
+
+Setting BRAND_BUILDER_CACHE=0 turns both caches off, e.g. for CI runs that
+must exercise the real API.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import orjson
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'jons-ai-tools', 'brand_builder_steps.sqlite3'
+)
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+GEMINI_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+GEMINI_MEMORY_SIZE = 256  # responses kept in process
+
+
+def caching_enabled() -> bool:
+    """Whether BRAND_BUILDER_CACHE leaves caching on (the default)"""
+    return os.environ.get('BRAND_BUILDER_CACHE', '1').lower() not in ('0', 'false', 'no')
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU map with optional per-entry expiry"""
+
+    def __init__(self, size: int, ttl: float = None):
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the value for a key, or None if it's missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entries beyond the size"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key) is not None
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+
+
+class _SQLiteCache:
+    """Thread-safe key -> JSON text table with per-entry expiry"""
+
+    table = None
+
+    def __init__(self, path: str = None, ttl: int = DEFAULT_TTL):
+        self.path = path or os.environ.get('BRAND_BUILDER_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, dropping entries that have expired since"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # Every distinct prompt or context adds a row, so without this
+            # purge the file would only ever grow
+            self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _hash(payload: Any) -> Optional[str]:
+        """SHA-256 of a JSON-serializable payload, or None if it isn't serializable"""
+        try:
+            text = json.dumps(payload, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _get(self, key: str) -> Optional[Any]:
+        """Decoded value for a key, if present and unexpired"""
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def _set(self, key: str, value: Any, ttl: int = None) -> None:
+        """Store a JSON-serializable value under a key"""
+        try:
+            text = json.dumps(value)
+        except (TypeError, ValueError):
+            return
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, text, expires_at)
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+
+class LLMStepCache(_SQLiteCache):
+    """SQLite-backed store of serialized StepResults"""
+
+    table = 'step_cache'
+
+    @classmethod
+    def make_key(cls, step_name: str, inputs: Dict[str, Any]) -> Optional[str]:
+        """Hash a step name and its inputs, or None if the inputs aren't JSON-serializable"""
+        return cls._hash({"step": step_name, "inputs": inputs})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached StepResult fields for a key, if present and unexpired"""
+        return self._get(key)
+
+    def set(self, key: str, result, ttl: int = None) -> None:
+        """Store a StepResult under a key"""
+        self._set(key, asdict(result), ttl)
+
+
+class GeminiResponseCache(_SQLiteCache):
+    """SQLite-backed store of raw Gemini response text, fronted by a memory tier"""
+
+    table = 'gemini_cache'
+
+    def __init__(self, path: str = None, ttl: int = GEMINI_CACHE_TTL):
+        super().__init__(path, ttl)
+        self._memory = MemoryCache(GEMINI_MEMORY_SIZE)
+
+    @classmethod
+    def make_key(cls, prompt: str, response_schema: Optional[Dict], temperature: float,
+                 model: str = None) -> Optional[str]:
+        """Hash everything that determines a response"""
+        return cls._hash({"prompt": prompt, "schema": response_schema, "temperature": temperature, "model": model})
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, checking memory before SQLite"""
+        response = self._memory.get(key)
+        if response is None:
+            response = self._get(key)
+            if response is not None:
+                self._memory.set(key, response)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in both tiers"""
+        self._memory.set(key, response)
+        self._set(key, response)
+
+    def clear(self) -> None:
+        """Remove every cached response from both tiers"""
+        self._memory.clear()
+        super().clear()
+
+
+_gemini_cache = None
+
+
+def _shared_gemini_cache() -> GeminiResponseCache:
+    """Process-wide Gemini response cache, created on first use"""
+    global _gemini_cache
+    if _gemini_cache is None:
+        _gemini_cache = GeminiResponseCache()
+    return _gemini_cache
+
+
+def _worth_storing(response: Any, check: Optional[Callable[[Any], List[str]]]) -> bool:
+    """Whether a response is complete JSON that check (a schema checker) has no problems with"""
+    if not isinstance(response, str) or not response:
+        return False
+    try:
+        data = orjson.loads(response)
+    except orjson.JSONDecodeError:
+        return False
+    return check is None or not check(data)
+
+
+def cached_gemini_call(call: Callable[..., str], prompt: str, response_schema: Dict = None,
+                       temperature: float = 0.2, model: str = None,
+                       check: Callable[[Any], List[str]] = None) -> str:
+    """Call a Gemini API function, reusing an earlier identical response
+
+    Failed calls raise and are never stored. A response is only stored once
+    it decodes as JSON and, when a schema checker is passed as check, has no
+    problems against it, so a truncated or drifted response is requested
+    again next time instead of being replayed. Pass the model the call uses
+    so a model change doesn't replay stale responses.
+    """
+    if not caching_enabled():
+        return call(prompt, response_schema=response_schema, temperature=temperature)
+    
+    cache = _shared_gemini_cache()
+    key = GeminiResponseCache.make_key(prompt, response_schema, temperature, model)
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    response = call(prompt, response_schema=response_schema, temperature=temperature)
+    if key is not None and _worth_storing(response, check):
+        cache.set(key, response)
+    return response
+
+
+def cached_gemini_stream(stream: Callable[..., Iterator[str]], prompt: str, response_schema: Dict = None,
+                         temperature: float = 0.2, model: str = None,
+                         check: Callable[[Any], List[str]] = None) -> Iterator[str]:
+    """Stream a Gemini response, replaying an earlier identical one in a single chunk
+
+    Shares its entries with cached_gemini_call. A streamed response is only
+    stored once the stream has finished without raising and the whole text
+    passes the same checks as cached_gemini_call's.
+    """
+    if not caching_enabled():
+        yield from stream(prompt, response_schema=response_schema, temperature=temperature)
+        return
+    
+    cache = _shared_gemini_cache()
+    key = GeminiResponseCache.make_key(prompt, response_schema, temperature, model)
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    parts = []
+    for chunk in stream(prompt, response_schema=response_schema, temperature=temperature):
+        parts.append(chunk)
+        yield chunk
+
+    response = ''.join(parts)
+    if key is not None and _worth_storing(response, check):
+        cache.set(key, response)
@@ -0,0 +1,70 @@
+"""
+Lenient decoding of LLM JSON responses
+
+Structured output normally returns one bare JSON object, but responses can
+still arrive wrapped in a code fence or surrounded by commentary.
+robust_json_parse recovers the object from those without raising, and has
+no dependencies beyond the JSON libraries so it can be imported (and
+tested) on its own.
+"""
+
+import json
+import re
+
+import orjson
+
+# Shared decoder so robust_json_parse can decode from an arbitrary offset
+_JSON_DECODER = json.JSONDecoder()
+
+# Body of a ```json (or bare ```) fenced block
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+
+def robust_json_parse(response_text):
+    """
+    Robust JSON parsing for LLM responses
+    
+    Args:
+        response_text: The raw response text from API, or an already-parsed
+            object when the structured-output path returns one
+        
+    Returns:
+        tuple: (success: bool, data: dict, error_msg: str)
+    """
+    # Structured-output responses may already be parsed - nothing to do
+    if isinstance(response_text, (dict, list)):
+        return True, response_text, None
+    
+    # Direct path: structured-output responses are already bare JSON
+    try:
+        return True, orjson.loads(response_text), None
+    except orjson.JSONDecodeError:
+        pass
+    
+    # Prefer the body of a fenced code block when there is one
+    fence = _JSON_FENCE_RE.search(response_text)
+    candidate = fence.group(1) if fence else response_text
+    
+    # Checking bracket offsets up front lets refusals and truncated generations
+    # fail without raising (and catching) a decode error
+    start_idx = candidate.find('{')
+    end_idx = candidate.rfind('}')
+    if start_idx == -1 or end_idx < start_idx:
+        return False, {}, f"No valid JSON brackets found in response: {response_text[:200]}..."
+    
+    # The outermost braces usually delimit exactly one object
+    try:
+        return True, orjson.loads(candidate[start_idx:end_idx + 1]), None
+    except orjson.JSONDecodeError:
+        pass
+    
+    # Otherwise decode from the first '{'; raw_decode stops at the end of the
+    # object so trailing commentary (even with braces in it) is ignored
+    try:
+        result_data, _ = _JSON_DECODER.raw_decode(candidate, start_idx)
+        return True, result_data, None
+    except json.JSONDecodeError as e:
+        return False, {}, (
+            f"JSON parsing failed: {e.msg} at char {e.pos}. "
+            f"Response starts with: {response_text[:100]}... Response ends with: {response_text[-100:]}"
+        )
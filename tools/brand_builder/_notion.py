@@ -0,0 +1,74 @@
+"""
+Shared Notion access for the workflow steps
+
+Steps that save to Notion use one client per API key, so its HTTP session
+(and TLS connection) is reused across saves, and submit page writes to one
+process-wide worker pool. A single pool keeps the total number of requests in
+flight within Notion's ~3 requests/second rate limit even when several steps
+or clients are running at once (e.g. a batch CLI run). Creating a page isn't
+idempotent, so it's only retried (with exponential backoff) when the request
+can't have been applied: it never connected, or Notion turned it away with a
+429 or 503.
+"""
+
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+NOTION_WRITE_WORKERS = 3
+NOTION_WRITE_ATTEMPTS = 3
+NOTION_RETRY_BACKOFF = 1.0  # seconds before the first retry, doubled for each one after
+NOTION_RETRY_MAX_WAIT = 10.0  # seconds
+
+# Responses that mean the request was rejected before being applied
+_TRANSIENT_STATUSES = frozenset({429, 503})
+
+notion_writes = ThreadPoolExecutor(max_workers=NOTION_WRITE_WORKERS, thread_name_prefix='notion-write')
+
+
+@functools.lru_cache(maxsize=None)
+def notion_client(auth: str):
+    """Shared Notion client for an API key"""
+    # Imported here so the notion_client/httpx import tree only loads on a save
+    from notion_client import Client
+    return Client(auth=auth)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed Notion request is safe to retry"""
+    import httpx
+    
+    # notion_client re-raises httpx timeouts as RequestTimeoutError, so look at
+    # the original error too; a read timeout may have created the page already
+    for cause in (error, error.__context__):
+        if isinstance(cause, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return True
+    return getattr(error, 'status', None) in _TRANSIENT_STATUSES
+
+
+def create_page(auth: str, parent: Dict[str, Any], properties: Dict[str, Any]) -> str:
+    """
+    Create a Notion page, retrying failures that can't have created it
+    
+    Args:
+        auth: Notion API key
+        parent: Page parent, e.g. {"database_id": ...}
+        properties: Page property values
+        
+    Returns:
+        The new page's id
+    """
+    client = notion_client(auth)
+    for attempt in range(NOTION_WRITE_ATTEMPTS):
+        try:
+            return client.pages.create(parent=parent, properties=properties)["id"]
+        except Exception as e:
+            if attempt == NOTION_WRITE_ATTEMPTS - 1 or not _is_transient(e):
+                raise
+            time.sleep(min(NOTION_RETRY_BACKOFF * 2 ** attempt, NOTION_RETRY_MAX_WAIT))
+
+
+def archive_page(auth: str, page_id: str) -> None:
+    """Archive a Notion page, e.g. one created for a response that later proved unusable"""
+    notion_client(auth).pages.update(page_id=page_id, archived=True)
@@ -0,0 +1,82 @@
+"""
+Local checks of LLM responses against their response schemas
+
+Gemini is asked for structured output, but nothing re-checks what comes back.
+compile_schema turns a response schema into a checker once, at import time,
+so each response is validated by a tree of small closures rather than by
+re-interpreting the schema dict on every call. Gemini should already enforce
+the schema, so steps report any problems found as warnings, not failures.
+
+Only the subset of JSON Schema the steps use is supported: "type" (object,
+array, string, number, integer, boolean), "properties", "required" and "items".
+"""
+
+from typing import Any, Callable, Dict, List
+
+_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+}
+
+
+def _compile(schema: Dict[str, Any], path: str) -> Callable[[Any, List[str]], None]:
+    """Build a checker that appends problems with a value at path to a list"""
+    expected = _TYPES.get(schema.get('type'))
+    checks = []
+
+    if schema.get('type') == 'object':
+        required = tuple(schema.get('required', ()))
+        properties = tuple(
+            (name, _compile(subschema, f"{path}.{name}"))
+            for name, subschema in schema.get('properties', {}).items()
+        )
+
+        def check_object(value, problems):
+            problems.extend(f"{path}.{name} is missing" for name in required if name not in value)
+            for name, check in properties:
+                if name in value:
+                    check(value[name], problems)
+        checks.append(check_object)
+
+    elif schema.get('type') == 'array' and 'items' in schema:
+        check_item = _compile(schema['items'], f"{path}[]")
+
+        def check_array(value, problems):
+            for item in value:
+                check_item(item, problems)
+        checks.append(check_array)
+
+    def check(value, problems):
+        # bool is an int subclass, so keep it out of number/integer fields
+        if expected is not None and (not isinstance(value, expected) or
+                                     (isinstance(value, bool) and expected is not bool)):
+            problems.append(f"{path} should be {schema['type']}, got {type(value).__name__}")
+            return
+        for nested in checks:
+            nested(value, problems)
+
+    return check
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], List[str]]:
+    """
+    Compile a response schema into a checker
+
+    Args:
+        schema: Response schema as passed to call_gemini_api
+
+    Returns:
+        Function returning a list of problems with a parsed response (empty if it matches)
+    """
+    check = _compile(schema, 'response')
+
+    def validate(data: Any) -> List[str]:
+        problems = []
+        check(data, problems)
+        return problems
+
+    return validate
@@ -0,0 +1,59 @@
+"""
+Incremental parsing of streamed JSON responses
+
+A step whose response is an object wrapping one large array (e.g. Step 3's
+content_samples) can act on each element as soon as it has been generated,
+rather than waiting for the whole response before decoding it.
+"""
+
+import json
+import re
+from typing import Any, Iterable, Iterator, List
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = ' \t\r\n,'
+
+
+def iter_array_items(chunks: Iterable[str], key: str, parts: List[str]) -> Iterator[Any]:
+    """
+    Yield the elements of a streamed object's `key` array as each one completes
+
+    Args:
+        chunks: Text chunks of a JSON object, e.g. from a streaming Gemini call
+        key: Name of the array whose elements should be yielded
+        parts: List every chunk is appended to, so the caller can decode the
+            whole response once the stream is exhausted
+
+    Yields:
+        Each decoded array element, in order
+    """
+    array_start = re.compile(rf'"{re.escape(key)}"\s*:\s*\[')
+    buffer = ''
+    pos = None  # Offset of the next element, once the array has opened
+    finished = False
+
+    for chunk in chunks:
+        parts.append(chunk)
+        if finished:
+            continue
+        buffer += chunk
+
+        if pos is None:
+            match = array_start.search(buffer)
+            if match is None:
+                continue
+            pos = match.end()
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == ']':
+                finished = True
+                break
+            try:
+                item, pos = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Element is still incomplete - wait for more text
+            yield item
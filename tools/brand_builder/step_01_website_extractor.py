@@ -9,77 +9,160 @@ Can be run independently for testing:
     python -m tools.brand_builder.step_01_website_extractor --website https://example.com --client "Test Client"
 """
 
-import json
-import requests
-import trafilatura
+import functools
+import orjson
 import re
-from bs4 import BeautifulSoup
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from concurrent.futures import ThreadPoolExecutor
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
+from tools.brand_builder._cache import MemoryCache, cached_gemini_call
+from tools.brand_builder._schema import compile_schema
 from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
+# Contact-detail patterns for the fallback text scan, fused into one regex so
+# the page text is scanned once; the matching group names the kind of detail
+_CONTACT_PATTERNS = {
+    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b',
+    'phone': '|'.join((
+        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # XXX-XXX-XXXX or XXX.XXX.XXXX
+        r'\(\d{3}\)\s*\d{3}[-.]?\d{4}\b',  # (XXX) XXX-XXXX
+        r'\+1[-\s]?\d{3}[-\s]?\d{3}[-\s]?\d{4}\b'  # +1-XXX-XXX-XXXX
+    )),
+    # Bounded path that stops at HTML/quote terminators, so minified single-line
+    # pages can't drive long greedy runs
+    'social': r'\bhttps?://(?:www\.)?(?:linkedin|twitter|facebook|instagram|youtube)\.com/[^\s<>"\')]{1,256}',
+}
+_CONTACT_RE = re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in _CONTACT_PATTERNS.items()))
+_CONTACT_CAP = 32  # distinct values kept per kind; far more than a section ever shows
+_CONTACT_LABELS = {
+    'email': "Email pattern found",
+    'phone': "Phone pattern found",
+    'social': "Social media URL found",
+}
+
+# Section text cleanup for the extraction prompt: double quotes become single
+# quotes and line breaks/tabs become spaces, in one translate pass
+_CLEAN_TABLE = str.maketrans({'"': "'", '\n': ' ', '\r': ' ', '\t': ' '})
+
+# Target pages to scrape: (section, path variations in order of preference)
+_TARGET_PAGES = (
+    ('homepage', ('',)),
+    ('about', ('/about', '/about-us', '/company', '/who-we-are')),
+    ('contact', ('/contact', '/contact-us', '/get-in-touch')),
+    ('mission', ('/mission', '/values', '/vision', '/purpose')),
+    ('services', ('/services', '/what-we-do', '/solutions', '/products')),
+)
+_SCHEME_RE = re.compile(r'https?://')
+
+# Connections kept per host by the fallback session
+_MAX_PAGE_FETCHES = 16
+
+# Successfully extracted page text by URL, shared by the section fetch threads
+_PAGE_CACHE_SIZE = 256
+_PAGE_CACHE_TTL = 15 * 60  # seconds, so a long-running app picks up site edits
+_PAGE_CACHE = MemoryCache(_PAGE_CACHE_SIZE, ttl=_PAGE_CACHE_TTL)
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Social media links: a URL whose host is, or is a subdomain of, one of the
+# known sites, with or without a scheme (e.g. "www.facebook.com/x") - checked
+# with one anchored regex match per href
+_SOCIAL_LINK_RE = re.compile(
+    r'(?:(?:https?:)?//)?(?:[\w-]+\.)*(?:linkedin|twitter|facebook|instagram|youtube|tiktok)\.com(?:[/:?#]|$)',
+    re.IGNORECASE
+)
+
+
+def _link_contacts(hrefs):
+    """Contact details found in link targets (mailto:, tel: and social media)
+    
+    Links repeated across header, body and footer are reported once; a dict
+    accumulates them so first-seen order is kept.
+    """
+    contacts = {}
+    for href in hrefs:
+        if href.startswith('mailto:'):
+            contacts[f"Email found: {href.removeprefix('mailto:')}"] = None
+        elif href.startswith('tel:'):
+            contacts[f"Phone found: {href.removeprefix('tel:')}"] = None
+        elif _SOCIAL_LINK_RE.match(href):
+            contacts[f"Social media found: {href}"] = None
+    return list(contacts)
+
+
+@functools.lru_cache(maxsize=None)
+def _session():
+    """Shared session so fallback fetches reuse pooled keep-alive connections"""
+    # Imported on first fetch, so discovering the step doesn't load requests/urllib3
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=_MAX_PAGE_FETCHES, pool_maxsize=_MAX_PAGE_FETCHES))
+    session.mount('http://', HTTPAdapter(pool_connections=_MAX_PAGE_FETCHES, pool_maxsize=_MAX_PAGE_FETCHES))
+    session.headers.update({'User-Agent': _USER_AGENT})
+    return session
+
 
 def extract_content_from_url(url):
     """
     Extract text content from a URL
     
+    Successful extractions are kept in a small in-process cache for a few
+    minutes, so retries and repeated runs against the same site don't re-fetch
+    pages. Errors are not cached.
+    
     Args:
         url (str): The URL to extract content from
         
     Returns:
         str: The extracted text content
     """
+    cached = _PAGE_CACHE.get(url)
+    if cached is not None:
+        return cached
+    
+    content = _fetch_content_from_url(url)
+    if not content.startswith("Error"):
+        _PAGE_CACHE.set(url, content)
+    return content
+
+
+def _fetch_content_from_url(url):
+    """Fetch a URL and extract its text content (uncached)"""
+    # Imported on first fetch: trafilatura pulls in lxml, htmldate, justext etc.
+    import trafilatura
+    from trafilatura.utils import load_html
+    from bs4 import BeautifulSoup
+    
     try:
         # Use trafilatura for effective text extraction (handles most modern websites well)
         downloaded = trafilatura.fetch_url(url)
-        if downloaded:
+        # Parse once with trafilatura's own loader (an lxml tree) and share the tree
+        # between link scanning and extraction
+        tree = load_html(downloaded) if downloaded else None
+        if tree is not None:
+            # Links are read first because trafilatura prunes the tree it is given
+            hrefs = tree.xpath('//a/@href')
+            
             # Extract with more comprehensive options to capture contact info
-            extracted_text = trafilatura.extract(downloaded, 
+            extracted_text = trafilatura.extract(tree, 
                                                include_comments=False, 
                                                include_tables=True,  # Include tables (often contain contact info)
                                                include_links=True)   # Include links (social media)
             if extracted_text:
-                # Also extract contact information patterns using BeautifulSoup
-                soup = BeautifulSoup(downloaded, 'html.parser')
-                
-                # Look for common contact information patterns
-                contact_patterns = []
-                
-                # Find email addresses in href attributes
-                email_links = soup.find_all('a', href=True)
-                for link in email_links:
-                    if 'mailto:' in link['href']:
-                        contact_patterns.append(f"Email found: {link['href'].replace('mailto:', '')}")
-                
-                # Find phone links
-                phone_links = soup.find_all('a', href=True)
-                for link in phone_links:
-                    if 'tel:' in link['href']:
-                        contact_patterns.append(f"Phone found: {link['href'].replace('tel:', '')}")
-                
-                # Find social media links
-                social_domains = ['linkedin.com', 'twitter.com', 'facebook.com', 'instagram.com', 'youtube.com', 'tiktok.com']
-                social_links = soup.find_all('a', href=True)
-                for link in social_links:
-                    for domain in social_domains:
-                        if domain in link['href']:
-                            contact_patterns.append(f"Social media found: {link['href']}")
-                            break
+                # Look for common contact information patterns in one pass over the links
+                contact_patterns = _link_contacts(hrefs)
                 
                 # Add contact patterns to extracted text
                 if contact_patterns:
-                    extracted_text += "\\n\\n=== EXTRACTED CONTACT INFORMATION ===\\n" + "\\n".join(contact_patterns)
+                    extracted_text += "\n\n=== EXTRACTED CONTACT INFORMATION ===\n" + "\n".join(contact_patterns)
                 
                 return extracted_text
         
         # Fallback to BeautifulSoup if trafilatura fails
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }, timeout=10)
+        response = _session().get(url, timeout=10)
         
         if response.status_code == 200:
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -88,51 +171,41 @@ def extract_content_from_url(url):
             for script in soup(["script", "style"]):
                 script.extract() 
             
-            # Get text
-            text = soup.get_text()
-            
-            # Break into lines and remove leading and trailing space on each
-            lines = (line.strip() for line in text.splitlines()) 
-            # Break multi-headlines into a line each
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            # Drop blank lines
-            text = '\\n'.join(chunk for chunk in chunks if chunk)
-            
-            # Extract contact information patterns from text
-            contact_info = []
+            # Classify mailto/tel/social links in a single walk over the <a> tags
+            contact_info = _link_contacts(link['href'] for link in soup.find_all('a', href=True))
             
-            # Find email patterns in text
-            email_pattern = r'\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{2,}\\b'
-            emails = re.findall(email_pattern, text)
-            for email in set(emails):  # Remove duplicates
-                contact_info.append(f"Email pattern found: {email}")
+            # Get text in one pass: each stripped string, with multi-headlines
+            # broken into a line each and blank lines dropped
+            parts = []
+            for string in soup.stripped_strings:
+                for chunk in string.split("  "):
+                    chunk = chunk.strip()
+                    if chunk:
+                        parts.append(chunk)
+            text = '\n'.join(parts)
             
-            # Find phone patterns
-            phone_patterns = [
-                r'\\b\\d{3}[-.]?\\d{3}[-.]?\\d{4}\\b',  # XXX-XXX-XXXX or XXX.XXX.XXXX
-                r'\\(\\d{3}\\)\\s*\\d{3}[-.]?\\d{4}',    # (XXX) XXX-XXXX
-                r'\\+1[-\\s]?\\d{3}[-\\s]?\\d{3}[-\\s]?\\d{4}'  # +1-XXX-XXX-XXXX
-            ]
-            for pattern in phone_patterns:
-                phones = re.findall(pattern, text)
-                for phone in set(phones):  # Remove duplicates
-                    contact_info.append(f"Phone pattern found: {phone}")
+            # Extract contact information patterns from text in a single scan,
+            # de-duplicating within each kind (dicts keep first-seen order) and
+            # stopping once every kind has reached its cap
+            found = {kind: {} for kind in _CONTACT_PATTERNS}
+            full_kinds = 0
+            for match in _CONTACT_RE.finditer(text):
+                values = found[match.lastgroup]
+                if len(values) < _CONTACT_CAP:
+                    values[match.group()] = None
+                    if len(values) == _CONTACT_CAP:
+                        full_kinds += 1
+                        if full_kinds == len(found):
+                            break
             
-            # Find social media URLs in text
-            social_patterns = [
-                r'https?://(?:www\\.)?linkedin\\.com/[^\\s]+',
-                r'https?://(?:www\\.)?twitter\\.com/[^\\s]+', 
-                r'https?://(?:www\\.)?facebook\\.com/[^\\s]+',
-                r'https?://(?:www\\.)?instagram\\.com/[^\\s]+',
-                r'https?://(?:www\\.)?youtube\\.com/[^\\s]+'
-            ]
-            for pattern in social_patterns:
-                social_urls = re.findall(pattern, text)
-                for url in set(social_urls):
-                    contact_info.append(f"Social media URL found: {url}")
+            contact_info.extend(
+                f"{_CONTACT_LABELS[kind]}: {value}"
+                for kind, values in found.items()
+                for value in values
+            )
             
             if contact_info:
-                text += "\\n\\n=== EXTRACTED CONTACT INFORMATION ===\\n" + "\\n".join(contact_info)
+                text += "\n\n=== EXTRACTED CONTACT INFORMATION ===\n" + "\n".join(contact_info)
             
             return text
         else:
@@ -142,6 +215,32 @@ def extract_content_from_url(url):
         return f"Error extracting content: {str(e)}"
 
 
+def _page_exists(url):
+    """HEAD preflight: False only when the server says the page is missing"""
+    if url in _PAGE_CACHE:
+        return True
+    import requests
+    try:
+        response = _session().head(url, allow_redirects=True, timeout=5)
+    except requests.RequestException:
+        # Plenty of servers drop or reset HEAD requests; let the full GET decide
+        return True
+    # Others refuse HEAD with 403/405 etc., so only a definite "not found" skips the GET
+    return response.status_code not in (404, 410)
+
+
+def _first_page_content(urls):
+    """Content of the first URL that extracts successfully, or None"""
+    for url in urls:
+        # Most sites lack most path variations; a HEAD preflight skips those cheaply
+        if not _page_exists(url):
+            continue
+        content = extract_content_from_url(url)
+        if content and not content.startswith("Error"):
+            return content
+    return None
+
+
 def extract_targeted_content(base_url):
     """
     Extract content from multiple targeted pages on a website
@@ -154,36 +253,25 @@ def extract_targeted_content(base_url):
     """
     content_sections = {}
     
-    # Target pages to scrape
-    target_pages = {
-        'homepage': '',
-        'about': ['/about', '/about-us', '/company', '/who-we-are'],
-        'contact': ['/contact', '/contact-us', '/get-in-touch'],
-        'mission': ['/mission', '/values', '/vision', '/purpose'],
-        'services': ['/services', '/what-we-do', '/solutions', '/products']
-    }
-    
     # Normalize base URL
-    if not base_url.startswith(('http://', 'https://')):
+    if not _SCHEME_RE.match(base_url):
         base_url = 'https://' + base_url
     base_url = base_url.rstrip('/')
     
-    for section, paths in target_pages.items():
-        content = None
-        
-        if section == 'homepage':
-            # Extract homepage content
-            content = extract_content_from_url(base_url)
-        else:
-            # Try different path variations
-            for path in paths:
-                url = base_url + path
-                temp_content = extract_content_from_url(url)
-                if temp_content and not temp_content.startswith("Error"):
-                    content = temp_content
-                    break
-        
-        if content and not content.startswith("Error"):
+    # Candidate URLs per section, in order of preference
+    candidates = {
+        section: [base_url + path for path in paths]
+        for section, paths in _TARGET_PAGES
+    }
+    
+    # Fetching is pure network wait, so the sections are fetched concurrently;
+    # within a section the path variations are tried in order, stopping at the
+    # first that returns content, so no more pages are requested than before
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        pages = dict(zip(candidates, executor.map(_first_page_content, candidates.values())))
+    
+    for section, content in pages.items():
+        if content:
             # Limit content length per section
             if len(content) > 2000:
                 content = content[:2000] + "...[truncated]"
@@ -192,6 +280,50 @@ def extract_targeted_content(base_url):
     return content_sections
 
 
+# Fields the extraction prompt asks for, with a description of each
+_WEBSITE_PROMPT_SCHEMA = {
+    "industry": "Primary business sector/industry (be specific)",
+    "company_description": "Clear 2-3 sentence description of what the company does",
+    "key_products_services": ["Service 1", "Service 2", "Product 3"],
+    "contact_email": "Primary business email or 'Not found'",
+    "phone_number": "Primary phone number or 'Not found'",
+    "address": "Complete business address or 'Not found'",
+    "linkedin_url": "Full LinkedIn URL or 'Not found'",
+    "twitter_url": "Full Twitter/X URL or 'Not found'",
+    "facebook_url": "Full Facebook URL or 'Not found'",
+    "instagram_url": "Full Instagram URL or 'Not found'",
+    "youtube_url": "Full YouTube URL or 'Not found'",
+    "other_social_media": ["Additional social platform URLs"],
+    "target_markets": ["Market 1", "Market 2"],
+    "company_size_indicators": "Small/Medium/Large business indicators found",
+    "geographical_presence": "Locations served or mentioned"
+}
+
+# Response schema for the extraction call, and its local checker
+_WEBSITE_API_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "industry": {"type": "string"},
+        "company_description": {"type": "string"},
+        "key_products_services": {"type": "array", "items": {"type": "string"}},
+        "contact_email": {"type": "string"},
+        "phone_number": {"type": "string"},
+        "address": {"type": "string"},
+        "linkedin_url": {"type": "string"},
+        "twitter_url": {"type": "string"},
+        "facebook_url": {"type": "string"},
+        "instagram_url": {"type": "string"},
+        "youtube_url": {"type": "string"},
+        "other_social_media": {"type": "array", "items": {"type": "string"}},
+        "target_markets": {"type": "array", "items": {"type": "string"}},
+        "company_size_indicators": {"type": "string"},
+        "geographical_presence": {"type": "string"}
+    },
+    "required": ["industry", "company_description", "key_products_services"]
+}
+_check_website_info = compile_schema(_WEBSITE_API_SCHEMA)
+
+
 class WebsiteExtractorTool(WorkflowStep):
     """
     Step 1: Extract basic company information and contact details from website
@@ -227,84 +359,51 @@ class WebsiteExtractorTool(WorkflowStep):
                 )
             
             # Build multi-content input structure
-            content_input = "=== WEBSITE CONTENT ANALYSIS ===\\n\\n"
+            parts = ["=== WEBSITE CONTENT ANALYSIS ===\n\n"]
             
             for section, content in content_sections.items():
                 if content:
                     # Clean content for each section
-                    clean_content = content.replace('"', "'").replace('\\n', ' ').replace('\\r', ' ').replace('\\t', ' ')
-                    content_input += f"=== {section.upper()} PAGE ===\\n{clean_content}\\n\\n"
+                    clean_content = content.translate(_CLEAN_TABLE)
+                    parts.append(f"=== {section.upper()} PAGE ===\n{clean_content}\n\n")
             
-            # Define extraction schema
-            schema = {
-                "industry": "Primary business sector/industry (be specific)",
-                "company_description": "Clear 2-3 sentence description of what the company does",
-                "key_products_services": ["Service 1", "Service 2", "Product 3"],
-                "contact_email": "Primary business email or 'Not found'",
-                "phone_number": "Primary phone number or 'Not found'",
-                "address": "Complete business address or 'Not found'",
-                "linkedin_url": "Full LinkedIn URL or 'Not found'",
-                "twitter_url": "Full Twitter/X URL or 'Not found'",
-                "facebook_url": "Full Facebook URL or 'Not found'",
-                "instagram_url": "Full Instagram URL or 'Not found'",
-                "youtube_url": "Full YouTube URL or 'Not found'",
-                "other_social_media": ["Additional social platform URLs"],
-                "target_markets": ["Market 1", "Market 2"],
-                "company_size_indicators": "Small/Medium/Large business indicators found",
-                "geographical_presence": "Locations served or mentioned"
-            }
+            content_input = ''.join(parts)
             
             # Get prompt and temperature from modular system
             prompt, temperature = prompt_wrapper.get_website_extraction_prompt(
                 client_name=client_name,
                 website_url=website_url,
                 content_input=content_input,
-                schema=schema
+                schema=_WEBSITE_PROMPT_SCHEMA
             )
             
-            # Create JSON schema for API validation
-            api_schema = {
-                "type": "object",
-                "properties": {
-                    "industry": {"type": "string"},
-                    "company_description": {"type": "string"},
-                    "key_products_services": {"type": "array", "items": {"type": "string"}},
-                    "contact_email": {"type": "string"},
-                    "phone_number": {"type": "string"},
-                    "address": {"type": "string"},
-                    "linkedin_url": {"type": "string"},
-                    "twitter_url": {"type": "string"},
-                    "facebook_url": {"type": "string"},
-                    "instagram_url": {"type": "string"},
-                    "youtube_url": {"type": "string"},
-                    "other_social_media": {"type": "array", "items": {"type": "string"}},
-                    "target_markets": {"type": "array", "items": {"type": "string"}},
-                    "company_size_indicators": {"type": "string"},
-                    "geographical_presence": {"type": "string"}
-                },
-                "required": ["industry", "company_description", "key_products_services"]
-            }
-            
             # Call API
-            response = universal_framework.call_gemini_api(prompt, response_schema=api_schema, temperature=temperature)
-            
-            # Check for API error responses before JSON parsing
-            if response.startswith("Error:"):
+            try:
+                response = cached_gemini_call(
+                    universal_framework.call_gemini_api, prompt, response_schema=_WEBSITE_API_SCHEMA, temperature=temperature,
+                    model=universal_framework.GEMINI_MODEL, check=_check_website_info
+                )
+            except universal_framework.GeminiAPIError as e:
                 return StepResult(
                     success=False,
                     data={},
-                    errors=[f"API call failed: {response}"],
+                    errors=[f"API call failed: {e}"],
                     warnings=[],
                     step_name=self.name
                 )
             
-            result_data = json.loads(response)
+            # Structured-output responses may already be parsed
+            result_data = response if isinstance(response, dict) else orjson.loads(response)
+            
+            warnings = []
+            if schema_problems := _check_website_info(result_data):
+                warnings.append(f"Website extraction response did not match its schema: {'; '.join(schema_problems)}")
             
             return StepResult(
                 success=True,
                 data=result_data,
                 errors=[],
-                warnings=[],
+                warnings=warnings,
                 step_name=self.name
             )
             
@@ -318,6 +417,9 @@ class WebsiteExtractorTool(WorkflowStep):
             )
 
 
+STEP_CLASS = WebsiteExtractorTool
+
+
 def main():
     """CLI interface for testing step independently"""
     import argparse
@@ -345,8 +447,8 @@ def main():
         print(f"📊 Extracted {len(result.data)} fields")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(result.data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(result.data, option=orjson.OPT_INDENT_2))
             print(f"💾 Results saved to {args.output}")
         else:
             print("📋 Results:")
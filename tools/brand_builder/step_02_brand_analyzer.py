@@ -7,37 +7,108 @@ deep brand voice insights.
 
 Can be run independently for testing:
     python -m tools.brand_builder.step_02_brand_analyzer --input step1_output.json --client "Test Client"
+
+Or for many Step 1 outputs at once:
+    python -m tools.brand_builder.step_02_brand_analyzer --input-glob "step1_outputs/*.json" --client "Test Client" --output step2_outputs
 """
 
-import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import asyncio
+import orjson
+from typing import List, NamedTuple, Optional, Tuple
 
-from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
-from frameworks import universal_framework, research_tools_framework
+from tools.brand_builder import MAX_CONCURRENT_STEP_RUNS, WorkflowStep, WorkflowContext, StepResult
+from tools.brand_builder._batch import run_batch
+from tools.brand_builder._cache import cached_gemini_call
+from tools.brand_builder._json import robust_json_parse
+from tools.brand_builder._notion import create_page, notion_writes
+from tools.brand_builder._schema import compile_schema
+from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 from database_config import VOICE_GUIDELINES_DB_ID, NOTION_API_KEY
-from notion_client import Client
 
 
-def format_for_database(result_data):
-    """
-    Convert arrays to comma-separated strings for database storage
+class BrandAnalysis(NamedTuple):
+    """The fields Step 2 produces, with the defaults used when one is missing"""
+    current_target_audience: str = ""
+    ideal_target_audience: str = ""
+    brand_values: Tuple[str, ...] = ()
+    brand_mission: str = ""
+    value_proposition: str = ""
+    brand_personality_traits: Tuple[str, ...] = ()
+    communication_tone: str = ""
+    voice_characteristics: Tuple[str, ...] = ()
+    language_level: str = ""
+    desired_emotional_impact: Tuple[str, ...] = ()
+    brand_archetypes: Tuple[str, ...] = ()
+    competitive_differentiation: str = ""
+    content_themes: Tuple[str, ...] = ()
+    words_tones_to_avoid: Tuple[str, ...] = ()
+    messaging_priorities: Tuple[str, ...] = ()
     
-    Args:
-        result_data: Raw analysis results with arrays
-        
-    Returns:
-        dict: Formatted data for database storage
-    """
-    formatted = {}
-    for key, value in result_data.items():
-        if isinstance(value, list):
-            formatted[key] = ", ".join(str(item) for item in value)
-        else:
-            formatted[key] = str(value) if value is not None else ""
-    return formatted
+    @classmethod
+    def from_result(cls, result_data):
+        """Build from a parsed analysis dict, looking each field up once"""
+        defaults = cls._field_defaults
+        return cls._make(
+            defaults[name] if (value := result_data.get(name)) is None else value
+            for name in cls._fields
+        )
+
+
+def _as_text(value):
+    """Render an analysis field as database text, joining arrays with commas"""
+    # Strings are the common case, so they're checked first
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    # Any other iterable (list, tuple, set, generator) is joined, not repr'd
+    if hasattr(value, '__iter__') and not isinstance(value, dict):
+        return ", ".join(map(str, value))
+    return str(value)
+
+
+class _FieldText:
+    """Mapping for str.format_map that renders BrandAnalysis fields as text on lookup"""
+    
+    __slots__ = ('analysis',)
+    
+    def __init__(self, analysis):
+        self.analysis = analysis
+    
+    def __getitem__(self, key):
+        return _as_text(getattr(self.analysis, key))
+
+
+def _rich_text(content):
+    """Notion rich_text property value"""
+    return {"rich_text": [{"text": {"content": content}}]}
+
+
+def _title(content):
+    """Notion title property value"""
+    return {"title": [{"text": {"content": content}}]}
+
+
+# Voice Guidelines page pieces that don't depend on the analysis
+_VOICE_GUIDELINES_PARENT = {"database_id": VOICE_GUIDELINES_DB_ID}
+_STATUS_IN_PROGRESS = {"select": {"name": "In Progress"}}
+
+# Rich text properties and the templates their content is formatted from.
+# Note: the list-like ones should be multi_select but the database might not
+# have options configured, so rich_text avoids field type errors
+_VOICE_GUIDELINE_TEXT = (
+    ("Tone_Description", "{communication_tone}"),
+    ("Word_Choice_Guidelines", "Use: {content_themes}. Avoid: {words_tones_to_avoid}"),
+    ("Word_Choice_Analysis",
+     "Voice Characteristics: {voice_characteristics}\nPersonality Traits: {brand_personality_traits}"),
+    ("Recommendations",
+     "Brand Mission: {brand_mission}\nValue Proposition: {value_proposition}\n"
+     "Messaging Priorities: {messaging_priorities}"),
+)
+
+# Step warning when an analysis couldn't be saved
+_SAVE_FAILED_WARNING = "Failed to save analysis to Voice Guidelines database"
 
 
 def save_to_voice_guidelines_database(client_name, analysis_data):
@@ -46,7 +117,8 @@ def save_to_voice_guidelines_database(client_name, analysis_data):
     
     Args:
         client_name: Name of the client
-        analysis_data: Formatted analysis results
+        analysis_data: BrandAnalysis, or the raw analysis dict (arrays are
+            joined as they're written)
         
     Returns:
         bool: Success status
@@ -56,36 +128,21 @@ def save_to_voice_guidelines_database(client_name, analysis_data):
             print("⚠️ Voice Guidelines database not configured")
             return False
             
-        notion = Client(auth=NOTION_API_KEY)
+        # Fill in the per-call text; only the fields that are written get formatted
+        if not isinstance(analysis_data, BrandAnalysis):
+            analysis_data = BrandAnalysis.from_result(analysis_data)
+        fields = _FieldText(analysis_data)
+        properties = {
+            "Name": _title(f"{client_name} - Brand Analysis"),
+            "Status": _STATUS_IN_PROGRESS,
+        }
+        for name, template in _VOICE_GUIDELINE_TEXT:
+            properties[name] = _rich_text(template.format_map(fields))
         
         # Create Voice Guidelines record
-        response = notion.pages.create(
-            parent={"database_id": VOICE_GUIDELINES_DB_ID},
-            properties={
-                "Name": {
-                    "title": [{"text": {"content": f"{client_name} - Brand Analysis"}}]
-                },
-                "Status": {
-                    "select": {"name": "In Progress"}
-                },
-                "Tone_Description": {
-                    "rich_text": [{"text": {"content": analysis_data.get("communication_tone", "")}}]
-                },
-                "Word_Choice_Guidelines": {
-                    "rich_text": [{"text": {"content": f"Use: {analysis_data.get('content_themes', '')}. Avoid: {analysis_data.get('words_tones_to_avoid', '')}"}}]
-                },
-                # Note: These should be multi_select but database might not have options configured
-                # Using rich_text as fallback to avoid field type errors
-                "Word_Choice_Analysis": {
-                    "rich_text": [{"text": {"content": f"Voice Characteristics: {analysis_data.get('voice_characteristics', '')}\\nPersonality Traits: {analysis_data.get('brand_personality_traits', '')}"}}]
-                },
-                "Recommendations": {
-                    "rich_text": [{"text": {"content": f"Brand Mission: {analysis_data.get('brand_mission', '')}\\nValue Proposition: {analysis_data.get('value_proposition', '')}\\nMessaging Priorities: {analysis_data.get('messaging_priorities', '')}"}}]
-                }
-            }
-        )
+        page_id = create_page(NOTION_API_KEY, _VOICE_GUIDELINES_PARENT, properties)
         
-        print(f"✅ Saved brand analysis to Voice Guidelines database: {response['id']}")
+        print(f"✅ Saved brand analysis to Voice Guidelines database: {page_id}")
         return True
         
     except Exception as e:
@@ -93,56 +150,106 @@ def save_to_voice_guidelines_database(client_name, analysis_data):
         return False
 
 
-def robust_json_parse(response_text):
+def save_many_to_voice_guidelines_database(records):
     """
-    Robust JSON parsing with multiple fallback strategies
+    Save several clients' brand analyses to the Voice Guidelines database
+    
+    Records are written concurrently over the shared client, through the
+    shared Notion write pool that keeps requests within the rate limit.
     
     Args:
-        response_text: The raw response text from API
+        records: Iterable of (client_name, analysis_data) pairs
         
     Returns:
-        tuple: (success: bool, data: dict, error_msg: str)
+        list: Success status for each record, in order
     """
-    # Strategy 1: Direct parsing after basic cleanup
-    try:
-        clean_response = response_text.strip()
-        if clean_response.startswith('```json'):
-            clean_response = clean_response[7:]
-        if clean_response.endswith('```'):
-            clean_response = clean_response[:-3]
-        clean_response = clean_response.strip()
-        
-        result_data = json.loads(clean_response)
-        return True, result_data, None
-        
-    except json.JSONDecodeError:
-        pass  # Continue to Strategy 2
+    records = list(records)
+    if not records:
+        return []
     
-    # Strategy 2: Extract content between first { and last }
-    try:
-        start_idx = response_text.find('{')
-        end_idx = response_text.rfind('}')
-        if start_idx == -1 or end_idx == -1 or end_idx <= start_idx:
-            return False, {}, f"No valid JSON brackets found in response: {response_text[:200]}..."
-            
-        json_text = response_text[start_idx:end_idx+1]
-        result_data = json.loads(json_text)
-        return True, result_data, None
-        
-    except json.JSONDecodeError:
-        pass  # Continue to Strategy 3
+    return list(notion_writes.map(lambda record: save_to_voice_guidelines_database(*record), records))
+
+
+# Step 1 website fields and client form fields the analysis draws on
+_WEBSITE_FIELDS = (
+    'industry', 'company_description', 'key_products_services',
+    'target_markets', 'geographical_presence', 'company_size_indicators'
+)
+_FORM_FIELDS = (
+    'product_service_description', 'current_target_audience', 'ideal_target_audience',
+    'brand_values', 'brand_mission', 'desired_emotional_impact',
+    'brand_personality', 'words_tones_to_avoid'
+)
+
+# With skip_llm_if_possible set, Step 2 passes supplied fields through when
+# at most this many outputs are missing
+_MAX_MISSING_FOR_PASSTHROUGH = 3
+
+
+def _call_gemini_api(prompt, response_schema=None, temperature=0.2):
+    """call_gemini_api, failing fast when no API key is configured
     
-    # Strategy 3: Try research_tools_framework.clean_json_response
-    try:
-        cleaned = research_tools_framework.clean_json_response(response_text)
-        result_data = json.loads(cleaned)
-        return True, result_data, None
-        
-    except:
-        pass  # Continue to final fallback
+    Passed to cached_gemini_call, so the key is only required on a cache miss.
+    """
+    if not universal_framework.gemini_api_key_configured():
+        raise universal_framework.GeminiAPIError(
+            "Gemini API key is not configured (google.GEMINI_API_KEY in Streamlit secrets)"
+        )
+    return universal_framework.call_gemini_api(prompt, response_schema=response_schema, temperature=temperature)
+
+
+def _gather_fields(context, fields):
+    """The fields that have a value in the context, in the order given"""
+    return {field: value for field in fields if (value := context.get(field))}
+
+
+# Response schema for the brand voice analysis call; built once since it's
+# also part of the Gemini cache key
+_BRAND_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "current_target_audience": {"type": "string"},
+        "ideal_target_audience": {"type": "string"},
+        "brand_values": {"type": "array", "items": {"type": "string"}},
+        "brand_mission": {"type": "string"},
+        "value_proposition": {"type": "string"},
+        "brand_personality_traits": {"type": "array", "items": {"type": "string"}},
+        "communication_tone": {"type": "string"},
+        "voice_characteristics": {"type": "array", "items": {"type": "string"}},
+        "language_level": {"type": "string"},
+        "desired_emotional_impact": {"type": "array", "items": {"type": "string"}},
+        "brand_archetypes": {"type": "array", "items": {"type": "string"}},
+        "competitive_differentiation": {"type": "string"},
+        "content_themes": {"type": "array", "items": {"type": "string"}},
+        "words_tones_to_avoid": {"type": "array", "items": {"type": "string"}},
+        "messaging_priorities": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["current_target_audience", "ideal_target_audience", "brand_values", "brand_mission", "brand_personality_traits"]
+}
+_REQUIRED_ANALYSIS_FIELDS = tuple(_BRAND_ANALYSIS_SCHEMA["required"])
+_check_brand_analysis = compile_schema(_BRAND_ANALYSIS_SCHEMA)
+
+
+def _parse_brand_response(response_text):
+    """
+    Parse a brand analysis response, expecting the shape of _BRAND_ANALYSIS_SCHEMA
     
-    # Final fallback: Return detailed error
-    return False, {}, f"All JSON parsing strategies failed. Response starts with: {response_text[:100]}... Response ends with: {response_text[-100:]}"
+    Structured output normally returns exactly one bare object with the
+    required fields, which a single orjson decode handles. Anything else
+    (code fences, commentary, a drifted shape) goes through robust_json_parse.
+    
+    Returns:
+        tuple: (success: bool, data: dict, error_msg: str)
+    """
+    if isinstance(response_text, str) and response_text[:1] == '{':
+        try:
+            result_data = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if all(field in result_data for field in _REQUIRED_ANALYSIS_FIELDS):
+                return True, result_data, None
+    return robust_json_parse(response_text)
 
 
 class BrandAnalyzerTool(WorkflowStep):
@@ -157,20 +264,16 @@ class BrandAnalyzerTool(WorkflowStep):
         return ['step_01_website_extractor']  # Prefers website data but not required
     
     def get_output_fields(self):
-        return [
-            'current_target_audience', 'ideal_target_audience', 'brand_values',
-            'brand_mission', 'value_proposition', 'brand_personality_traits',
-            'communication_tone', 'voice_characteristics', 'language_level',
-            'desired_emotional_impact', 'brand_archetypes', 'competitive_differentiation',
-            'content_themes', 'words_tones_to_avoid', 'messaging_priorities'
-        ]
+        return list(BrandAnalysis._fields)
     
-    def validate_context(self, context: WorkflowContext):
+    def validate_context(self, context: WorkflowContext, website_data=None, form_data=None):
         """
         Validate required context data and warn about missing optional data
         
         Args:
             context: WorkflowContext with input data
+            website_data: Website fields already gathered from the context, if any
+            form_data: Form fields already gathered from the context, if any
             
         Returns:
             list: Warning messages for missing optional data
@@ -184,18 +287,20 @@ class BrandAnalyzerTool(WorkflowStep):
         if not context.get('client_name'):
             raise ValueError("client_name is required for brand analysis")
         
-        # Check optional but recommended inputs from Step 1
-        step1_fields = ['industry', 'company_description', 'key_products_services', 
-                       'target_markets', 'geographical_presence', 'company_size_indicators']
+        if website_data is None:
+            website_data = _gather_fields(context, _WEBSITE_FIELDS)
+        if form_data is None:
+            form_data = _gather_fields(context, _FORM_FIELDS)
         
-        missing_step1_data = [field for field in step1_fields if not context.get(field)]
+        # Check optional but recommended inputs from Step 1
+        missing_step1_data = [field for field in _WEBSITE_FIELDS if field not in website_data]
         
         if missing_step1_data:
             warnings.append(f"Missing website data from Step 1: {', '.join(missing_step1_data)}. Analysis will be less comprehensive.")
         
         # Check if we have any data at all to work with
-        has_website_data = any(context.get(field) for field in step1_fields)
-        has_form_data = any(context.get(field) for field in ['product_service_description', 'current_target_audience'])
+        has_website_data = len(missing_step1_data) < len(_WEBSITE_FIELDS)
+        has_form_data = 'product_service_description' in form_data or 'current_target_audience' in form_data
         
         if not has_website_data and not has_form_data:
             warnings.append("No website or form data available. Analysis will be based on client name only.")
@@ -204,27 +309,64 @@ class BrandAnalyzerTool(WorkflowStep):
     
     def execute(self, context: WorkflowContext) -> StepResult:
         """Execute brand voice analysis"""
+        result, analysis = self._analyze(context)
+        if analysis is not None and not save_to_voice_guidelines_database(context.get('client_name'), analysis):
+            result.warnings.append(_SAVE_FAILED_WARNING)
+        return result
+    
+    async def execute_many_async(self, contexts: List[WorkflowContext],
+                                 concurrency: int = MAX_CONCURRENT_STEP_RUNS) -> List[StepResult]:
+        """Analyze several contexts concurrently, then save their Voice Guidelines records as one batch"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze(context):
+            async with semaphore:
+                return await asyncio.to_thread(self._analyze, context)
+        
+        analyzed = await asyncio.gather(*(analyze(context) for context in contexts))
+        
+        # Flush every successful analysis through the Notion write pool at once
+        to_save = [
+            (context.get('client_name'), analysis, result)
+            for context, (result, analysis) in zip(contexts, analyzed)
+            if analysis is not None
+        ]
+        saved = await asyncio.to_thread(
+            save_many_to_voice_guidelines_database, [(client_name, analysis) for client_name, analysis, _ in to_save]
+        )
+        for (_, _, result), success in zip(to_save, saved):
+            if not success:
+                result.warnings.append(_SAVE_FAILED_WARNING)
+        
+        return [result for result, _ in analyzed]
+    
+    def _analyze(self, context: WorkflowContext) -> Tuple[StepResult, Optional[BrandAnalysis]]:
+        """Run the analysis without saving it: the result, and the analysis to save if it succeeded"""
         try:
-            # Validate context and get warnings
-            warnings = self.validate_context(context)
-            client_name = context.get('client_name')
+            # Get website data from Step 1 and form data, if available
+            website_data = _gather_fields(context, _WEBSITE_FIELDS)
+            form_data = _gather_fields(context, _FORM_FIELDS)
             
-            # Get website data from Step 1 if available
-            website_data = {}
-            for field in ['industry', 'company_description', 'key_products_services', 
-                         'target_markets', 'geographical_presence', 'company_size_indicators']:
-                if context.get(field):
-                    website_data[field] = context.get(field)
-            
-            # Get form data if available
-            form_data = {}
-            for field in ['product_service_description', 'current_target_audience', 'ideal_target_audience',
-                         'brand_values', 'brand_mission', 'desired_emotional_impact', 
-                         'brand_personality', 'words_tones_to_avoid']:
-                if context.get(field):
-                    form_data[field] = context.get(field)
+            # Validate context and get warnings, reusing the gathered fields
+            warnings = self.validate_context(context, website_data, form_data)
+            client_name = context.get('client_name')
             
-            # Get prompt and temperature from modular system
+            # Opt-in cheap mode: when the context already supplies nearly every
+            # output field, pass those through instead of calling Gemini
+            if context.get('skip_llm_if_possible'):
+                supplied = _gather_fields(context, BrandAnalysis._fields)
+                missing = [field for field in BrandAnalysis._fields if field not in supplied]
+                if len(missing) <= _MAX_MISSING_FOR_PASSTHROUGH:
+                    if missing:
+                        warnings.append(f"Gemini call skipped; left without: {', '.join(missing)}")
+                    # Handed back for saving to Voice Guidelines, as an analysed result is
+                    return StepResult(
+                        success=True,
+                        data={**website_data, **supplied},
+                        errors=[],
+                        warnings=warnings,
+                        step_name=self.name
+                    ), BrandAnalysis.from_result(supplied)
             
             # Get prompt and temperature from modular system
             prompt, temperature = prompt_wrapper.get_brand_voice_analysis_prompt(
@@ -233,44 +375,22 @@ class BrandAnalyzerTool(WorkflowStep):
                 form_data=form_data
             )
             
-            # Define API schema for brand voice analysis validation
-            api_schema = {
-                "type": "object",
-                "properties": {
-                    "current_target_audience": {"type": "string"},
-                    "ideal_target_audience": {"type": "string"},
-                    "brand_values": {"type": "array", "items": {"type": "string"}},
-                    "brand_mission": {"type": "string"},
-                    "value_proposition": {"type": "string"},
-                    "brand_personality_traits": {"type": "array", "items": {"type": "string"}},
-                    "communication_tone": {"type": "string"},
-                    "voice_characteristics": {"type": "array", "items": {"type": "string"}},
-                    "language_level": {"type": "string"},
-                    "desired_emotional_impact": {"type": "array", "items": {"type": "string"}},
-                    "brand_archetypes": {"type": "array", "items": {"type": "string"}},
-                    "competitive_differentiation": {"type": "string"},
-                    "content_themes": {"type": "array", "items": {"type": "string"}},
-                    "words_tones_to_avoid": {"type": "array", "items": {"type": "string"}},
-                    "messaging_priorities": {"type": "array", "items": {"type": "string"}}
-                },
-                "required": ["current_target_audience", "ideal_target_audience", "brand_values", "brand_mission", "brand_personality_traits"]
-            }
-            
             # Call API
-            response = universal_framework.call_gemini_api(prompt, response_schema=api_schema, temperature=temperature)
-            
-            # Check for API error responses before JSON parsing
-            if response.startswith("Error:"):
+            try:
+                response = cached_gemini_call(
+                    _call_gemini_api, prompt, response_schema=_BRAND_ANALYSIS_SCHEMA, temperature=temperature,
+                    model=universal_framework.GEMINI_MODEL, check=_check_brand_analysis
+                )
+            except universal_framework.GeminiAPIError as e:
                 return StepResult(
                     success=False,
                     data={},
-                    errors=[f"API call failed: {response}"],
+                    errors=[f"API call failed: {e}"],
                     warnings=[],
                     step_name=self.name
-                )
+                ), None
             
-            # Use robust JSON parsing with multiple fallback strategies
-            parse_success, result_data, parse_error = robust_json_parse(response)
+            parse_success, result_data, parse_error = _parse_brand_response(response)
             if not parse_success:
                 return StepResult(
                     success=False,
@@ -278,26 +398,21 @@ class BrandAnalyzerTool(WorkflowStep):
                     errors=[parse_error],
                     warnings=[],
                     step_name=self.name
-                )
+                ), None
+            
+            if schema_problems := _check_brand_analysis(result_data):
+                warnings.append(f"Analysis response did not match its schema: {'; '.join(schema_problems)}")
             
             # Combine with website data if available
             final_data = {**website_data, **result_data}
             
-            # Format data for database storage and save to Voice Guidelines
-            formatted_data = format_for_database(result_data)
-            database_success = save_to_voice_guidelines_database(client_name, formatted_data)
-            
-            # Add database save status to warnings if failed
-            if not database_success:
-                warnings.append("Failed to save analysis to Voice Guidelines database")
-            
             return StepResult(
                 success=True,
                 data=final_data,
                 errors=[],
                 warnings=warnings,
                 step_name=self.name
-            )
+            ), BrandAnalysis.from_result(result_data)
             
         except ValueError as e:
             # Context validation error
@@ -307,7 +422,7 @@ class BrandAnalyzerTool(WorkflowStep):
                 errors=[str(e)],
                 warnings=[],
                 step_name=self.name
-            )
+            ), None
         except Exception as e:
             return StepResult(
                 success=False,
@@ -315,7 +430,10 @@ class BrandAnalyzerTool(WorkflowStep):
                 errors=[f"Brand voice analysis failed: {str(e)}"],
                 warnings=[],
                 step_name=self.name
-            )
+            ), None
+
+
+STEP_CLASS = BrandAnalyzerTool
 
 
 def main():
@@ -323,19 +441,24 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Analyze brand voice for Brand Builder')
-    parser.add_argument('--client', required=True, help='Client name')
+    parser.add_argument('--client', required=True, help='Client name (default for --input-glob files without one)')
     parser.add_argument('--input', help='Input JSON file from previous step')
-    parser.add_argument('--output', help='Output file for results (JSON)')
+    parser.add_argument('--input-glob', help='Glob of input JSON files to analyze in one run, e.g. "step1_outputs/*.json"')
+    parser.add_argument('--output', help='Output file for results (JSON), or a directory with --input-glob')
     
     args = parser.parse_args()
     
+    if args.input_glob:
+        run_batch(BrandAnalyzerTool(), args.input_glob, args.client, args.output)
+        return
+    
     # Create context
     context_data = {'client_name': args.client}
     
     # Load input data if provided
     if args.input:
-        with open(args.input, 'r') as f:
-            input_data = json.load(f)
+        with open(args.input, 'rb') as f:
+            input_data = orjson.loads(f.read())
             context_data.update(input_data)
     
     context = WorkflowContext(context_data)
@@ -350,15 +473,16 @@ def main():
         print(f"📊 Generated {len(result.data)} brand insights")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(result.data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(result.data, option=orjson.OPT_INDENT_2))
             print(f"💾 Results saved to {args.output}")
         else:
             print("📋 Key Results:")
-            key_fields = ['brand_mission', 'brand_values', 'current_target_audience', 'brand_personality_traits']
-            for field in key_fields:
-                if field in result.data:
-                    print(f"  {field}: {result.data[field]}")
+            analysis = BrandAnalysis.from_result(result.data)
+            print(f"  brand_mission: {analysis.brand_mission}")
+            print(f"  brand_values: {analysis.brand_values}")
+            print(f"  current_target_audience: {analysis.current_target_audience}")
+            print(f"  brand_personality_traits: {analysis.brand_personality_traits}")
     else:
         print("❌ Brand analysis failed!")
         for error in result.errors:
@@ -8,16 +8,54 @@ Can be run independently for testing:
     python -m tools.brand_builder.step_03_content_collector --input step2_output.json --client "Test Client"
 """
 
-import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
+from tools.brand_builder._cache import cached_gemini_stream
+from tools.brand_builder._notion import archive_page, create_page, notion_writes
+from tools.brand_builder._schema import compile_schema
+from tools.brand_builder._stream import iter_array_items
 from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 from database_config import CONTENT_SAMPLES_DB_ID, NOTION_API_KEY
-from notion_client import Client
+
+# Response schema for the content collection call, and its local checker
+_CONTENT_SAMPLES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "content_samples": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "channel": {"type": "string"},
+                    "content_type": {"type": "string"},
+                    "sample_description": {"type": "string"},
+                    "strategic_notes": {"type": "string"}
+                },
+                "required": ["channel", "content_type", "sample_description", "strategic_notes"]
+            }
+        }
+    },
+    "required": ["content_samples"]
+}
+_check_content_samples = compile_schema(_CONTENT_SAMPLES_SCHEMA)
+
+# Brand overview lines for the prompt: label, then the context fields to take
+# it from in order of preference
+_BRAND_OVERVIEW_FIELDS = (
+    ("Industry", ('industry',)),
+    ("Description", ('product_service_description', 'company_description')),
+    ("Mission", ('brand_mission',)),
+    ("Values", ('brand_values',)),
+    ("Target Audience", ('ideal_target_audience', 'current_target_audience')),
+    ("Brand Personality", ('brand_personality', 'brand_personality_traits')),
+)
+
+
+def _rich_text(content):
+    """Notion rich_text property value"""
+    return {"rich_text": [{"text": {"content": content}}]}
 
 
 class ContentCollectorTool(WorkflowStep):
@@ -61,45 +99,29 @@ class ContentCollectorTool(WorkflowStep):
     
     def format_for_database(self, content_samples, client_id):
         """Format content samples for Content Samples database"""
-        formatted_samples = []
-        
-        for sample in content_samples:
-            # Convert to database format
-            formatted_sample = {
-                "Client": {"id": client_id},  # Relation to AI Client Library
-                "Channel": {"rich_text": [{"text": {"content": sample.get('channel', '')}}]},
-                "Content Type": {"rich_text": [{"text": {"content": sample.get('content_type', '')}}]},
-                "Description": {"rich_text": [{"text": {"content": sample.get('sample_description', '')}}]},
-                "Strategic Notes": {"rich_text": [{"text": {"content": sample.get('strategic_notes', '')}}]}
+        client_ref = {"id": client_id}  # Relation to AI Client Library, shared by every sample
+        return [
+            {
+                "Client": client_ref,
+                "Channel": _rich_text(sample.get('channel', '')),
+                "Content Type": _rich_text(sample.get('content_type', '')),
+                "Description": _rich_text(sample.get('sample_description', '')),
+                "Strategic Notes": _rich_text(sample.get('strategic_notes', ''))
             }
-            formatted_samples.append(formatted_sample)
-        
-        return formatted_samples
+            for sample in content_samples
+        ]
     
-    def save_to_content_samples_database(self, content_samples, client_id):
-        """Save content samples to Content Samples database"""
-        if not CONTENT_SAMPLES_DB_ID or not NOTION_API_KEY:
-            return None, "Content Samples database not configured"
-        
-        try:
-            notion = Client(auth=NOTION_API_KEY)
-            
-            # Format samples for database
-            formatted_samples = self.format_for_database(content_samples, client_id)
-            
-            # Save each sample as a separate record
-            created_ids = []
-            for sample in formatted_samples:
-                response = notion.pages.create(
-                    parent={"database_id": CONTENT_SAMPLES_DB_ID},
-                    properties=sample
-                )
-                created_ids.append(response["id"])
-            
-            return created_ids, None
-            
-        except Exception as e:
-            return None, f"Failed to save to Content Samples database: {str(e)}"
+    def _create_sample_page(self, properties):
+        """Create one Content Samples page and return its id"""
+        return create_page(NOTION_API_KEY, {"database_id": CONTENT_SAMPLES_DB_ID}, properties)
+    
+    def _archive_sample_pages(self, page_writes):
+        """Wait for submitted page writes and archive every page they created"""
+        for write in page_writes:
+            try:
+                archive_page(NOTION_API_KEY, write.result())
+            except Exception:
+                pass  # The write itself failed, or cleanup did; nothing more to do
     
     def execute(self, context: WorkflowContext) -> StepResult:
         """Execute content collection"""
@@ -117,16 +139,14 @@ class ContentCollectorTool(WorkflowStep):
         client_name = context.get('client_name')
         client_id = context.get('client_id')  # Get client ID for database relation
         
-        # Build context from brand data
-        brand_context = f"""
-**BRAND OVERVIEW:**
-- Company: {client_name}
-- Industry: {context.get('industry', 'Unknown')}
-- Description: {context.get('product_service_description', context.get('company_description', ''))}
-- Mission: {context.get('brand_mission', 'Not specified')}
-- Values: {context.get('brand_values', 'Not specified')}
-- Target Audience: {context.get('ideal_target_audience', context.get('current_target_audience', 'Not specified'))}
-- Brand Personality: {context.get('brand_personality', context.get('brand_personality_traits', 'Not specified'))}"""
+        # Build context from brand data, leaving out fields we have nothing for
+        brand_context_parts = ["", "**BRAND OVERVIEW:**", f"- Company: {client_name}"]
+        for label, fields in _BRAND_OVERVIEW_FIELDS:
+            for field in fields:
+                if value := context.get(field):
+                    brand_context_parts.append(f"- {label}: {value}")
+                    break
+        brand_context = "\n".join(brand_context_parts)
         
         industry_context = f"Industry: {context.get('industry', 'General')} - Consider industry-specific communication channels and content types."
         
@@ -138,55 +158,45 @@ class ContentCollectorTool(WorkflowStep):
                 target_channels=None  # Let AI suggest optimal channels
             )
             
-            # Define schema for API validation
-            api_schema = {
-                "type": "object",
-                "properties": {
-                    "content_samples": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "channel": {"type": "string"},
-                                "content_type": {"type": "string"},
-                                "sample_description": {"type": "string"},
-                                "strategic_notes": {"type": "string"}
-                            },
-                            "required": ["channel", "content_type", "sample_description", "strategic_notes"]
-                        }
-                    }
-                },
-                "required": ["content_samples"]
-            }
-            
-            # Call the AI
-            response = universal_framework.call_gemini_api(prompt, response_schema=api_schema, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
-                return StepResult(
-                    success=False,
-                    data={},
-                    errors=[f"API call failed: {response}"],
-                    warnings=[],
-                    step_name=self.name
+            # Stream the response, handing each content sample to the Notion
+            # write pool as soon as it's complete so page writes overlap generation
+            save_samples = bool(client_id and CONTENT_SAMPLES_DB_ID and NOTION_API_KEY)
+            parts = []
+            page_writes = []
+            try:
+                chunks = cached_gemini_stream(
+                    universal_framework.call_gemini_api_stream, prompt, response_schema=_CONTENT_SAMPLES_SCHEMA, temperature=temperature,
+                    model=universal_framework.GEMINI_MODEL, check=_check_content_samples
                 )
+                for sample in iter_array_items(chunks, 'content_samples', parts):
+                    if save_samples:
+                        properties = self.format_for_database([sample], client_id)[0]
+                        page_writes.append(notion_writes.submit(self._create_sample_page, properties))
+                
+                result_data = orjson.loads(''.join(parts))
+            except Exception:
+                # A failed or truncated stream mustn't leave pages behind
+                self._archive_sample_pages(page_writes)
+                raise
             
-            result_data = json.loads(response)
+            if schema_problems := _check_content_samples(result_data):
+                warnings.append(f"Content samples response did not match its schema: {'; '.join(schema_problems)}")
             
-            # Save to Content Samples database if client_id is available
-            if client_id and 'content_samples' in result_data:
-                created_ids, db_error = self.save_to_content_samples_database(
-                    result_data['content_samples'], 
-                    client_id
-                )
-                
-                if db_error:
-                    warnings.append(f"Database save failed: {db_error}")
+            # Collect the Content Samples database writes
+            if not client_id:
+                warnings.append("No client_id provided - content samples not saved to database")
+            elif not save_samples:
+                warnings.append("Database save failed: Content Samples database not configured")
+            elif schema_problems:
+                self._archive_sample_pages(page_writes)
+                warnings.append("Database save skipped: content samples response did not match its schema")
+            else:
+                try:
+                    created_ids = [write.result() for write in page_writes]
+                except Exception as e:
+                    warnings.append(f"Database save failed: Failed to save to Content Samples database: {str(e)}")
                 else:
                     print(f"✅ Saved {len(created_ids)} content samples to Content Samples database")
-            elif not client_id:
-                warnings.append("No client_id provided - content samples not saved to database")
             
             return StepResult(
                 success=True,
@@ -206,6 +216,9 @@ class ContentCollectorTool(WorkflowStep):
             )
 
 
+STEP_CLASS = ContentCollectorTool
+
+
 def main():
     """CLI interface for testing step independently"""
     import argparse
@@ -222,8 +235,8 @@ def main():
     
     # Load input data if provided
     if args.input:
-        with open(args.input, 'r') as f:
-            input_data = json.load(f)
+        with open(args.input, 'rb') as f:
+            input_data = orjson.loads(f.read())
             context_data.update(input_data)
     
     context = WorkflowContext(context_data)
@@ -238,8 +251,8 @@ def main():
         print(f"📊 Generated {len(result.data.get('content_samples', []))} content recommendations")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(result.data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(result.data, option=orjson.OPT_INDENT_2))
             print(f"💾 Results saved to {args.output}")
         else:
             print("📋 Content Samples:")
@@ -8,12 +8,10 @@ Can be run independently for testing:
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
+from typing import Tuple
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
-from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
 
@@ -31,63 +29,37 @@ class VoiceAuditorTool(WorkflowStep):
     def get_output_fields(self):
         return ['voice_audit_summary', 'content_analysis', 'voice_patterns']
     
-    def execute(self, context: WorkflowContext) -> StepResult:
-        """Execute voice audit"""
-        client_name = context.get('client_name')
+    def build_prompt(self, context: WorkflowContext) -> Tuple[str, float]:
+        """Build the voice audit prompt and its temperature"""
+        get = context.get
+        client_name = get('client_name')
         
-        try:
-            # Build brand profile for analysis
-            brand_profile = f"""
+        # Build brand profile for analysis
+        brand_profile = f"""
 **BRAND PROFILE:**
 - Company: {client_name}
-- Mission: {context.get('brand_mission', 'Not specified')}
-- Values: {context.get('brand_values', 'Not specified')}
-- Personality: {context.get('brand_personality_traits', 'Not specified')}
-- Target Audience: {context.get('ideal_target_audience', 'Not specified')}
-- Communication Tone: {context.get('communication_tone', 'Not specified')}"""
-            
-            content_samples = json.dumps(context.get('content_samples', []), indent=2)
-            industry_context = f"Industry: {context.get('industry', 'General')}"
-            
-            # Get prompt using wrapper system
-            prompt, temperature = prompt_wrapper.get_voice_audit_prompt(
-                brand_profile=brand_profile,
-                content_samples=content_samples,
-                industry_context=industry_context
-            )
-            
-            # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
-                return StepResult(
-                    success=False,
-                    data={},
-                    errors=[f"API call failed: {response}"],
-                    warnings=[],
-                    step_name=self.name
-                )
-            
-            # Parse response (implement robust parsing if needed)
-            result_data = json.loads(response)
-            
-            return StepResult(
-                success=True,
-                data=result_data,
-                errors=[],
-                warnings=[],
-                step_name=self.name
-            )
-            
-        except Exception as e:
-            return StepResult(
-                success=False,
-                data={},
-                errors=[f"Voice audit failed: {str(e)}"],
-                warnings=[],
-                step_name=self.name
-            )
+- Mission: {get('brand_mission', 'Not specified')}
+- Values: {get('brand_values', 'Not specified')}
+- Personality: {get('brand_personality_traits', 'Not specified')}
+- Target Audience: {get('ideal_target_audience', 'Not specified')}
+- Communication Tone: {get('communication_tone', 'Not specified')}"""
+        
+        content_samples = orjson.dumps(get('content_samples', [])).decode()
+        industry_context = f"Industry: {get('industry', 'General')}"
+        
+        # Get prompt using wrapper system
+        return prompt_wrapper.get_voice_audit_prompt(
+            brand_profile=brand_profile,
+            content_samples=content_samples,
+            industry_context=industry_context
+        )
+    
+    def execute(self, context: WorkflowContext) -> StepResult:
+        """Execute voice audit"""
+        return self.run_llm_step(self.build_prompt, context, "Voice audit")
+
+
+STEP_CLASS = VoiceAuditorTool
 
 
 def main():
@@ -8,12 +8,10 @@ Can be run independently for testing:
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
+from typing import Tuple
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
-from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
 
@@ -31,62 +29,37 @@ class AudienceDefinerTool(WorkflowStep):
     def get_output_fields(self):
         return ['detailed_personas', 'audience_segments', 'persona_insights']
     
-    def execute(self, context: WorkflowContext) -> StepResult:
-        """Execute audience definition"""
-        client_name = context.get('client_name')
+    def build_prompt(self, context: WorkflowContext) -> Tuple[str, float]:
+        """Build the audience definition prompt and its temperature"""
+        get = context.get
+        client_name = get('client_name')
         
-        try:
-            # Build context from previous steps
-            brand_context = f"""
+        # Build context from previous steps
+        brand_context = f"""
 **BRAND CONTEXT:**
 - Company: {client_name}
-- Industry: {context.get('industry', 'Unknown')}
-- Target Audience: {context.get('ideal_target_audience', 'Not specified')}
-- Brand Values: {context.get('brand_values', 'Not specified')}"""
-            
-            content_insights = json.dumps(context.get('content_samples', []), indent=2)
-            voice_insights = json.dumps(context.get('voice_audit_summary', {}), indent=2)
-            industry_context = f"Industry: {context.get('industry', 'General')}"
-            
-            # Get prompt using wrapper system
-            prompt, temperature = prompt_wrapper.get_audience_definer_prompt(
-                brand_context=brand_context,
-                content_insights=content_insights,
-                voice_insights=voice_insights,
-                industry_context=industry_context
-            )
-            
-            # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
-                return StepResult(
-                    success=False,
-                    data={},
-                    errors=[f"API call failed: {response}"],
-                    warnings=[],
-                    step_name=self.name
-                )
-            
-            result_data = json.loads(response) 
-            
-            return StepResult(
-                success=True,
-                data=result_data,
-                errors=[],
-                warnings=[],
-                step_name=self.name
-            )
-            
-        except Exception as e:
-            return StepResult(
-                success=False,
-                data={},
-                errors=[f"Audience definition failed: {str(e)}"],
-                warnings=[],
-                step_name=self.name
-            )
+- Industry: {get('industry', 'Unknown')}
+- Target Audience: {get('ideal_target_audience', 'Not specified')}
+- Brand Values: {get('brand_values', 'Not specified')}"""
+        
+        content_insights = orjson.dumps(get('content_samples', [])).decode()
+        voice_insights = orjson.dumps(get('voice_audit_summary', {})).decode()
+        industry_context = f"Industry: {get('industry', 'General')}"
+        
+        # Get prompt using wrapper system
+        return prompt_wrapper.get_audience_definer_prompt(
+            brand_context=brand_context,
+            content_insights=content_insights,
+            voice_insights=voice_insights,
+            industry_context=industry_context
+        )
+    
+    def execute(self, context: WorkflowContext) -> StepResult:
+        """Execute audience definition"""
+        return self.run_llm_step(self.build_prompt, context, "Audience definition")
+
+
+STEP_CLASS = AudienceDefinerTool
 
 
 def main():
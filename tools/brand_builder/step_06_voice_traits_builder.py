@@ -8,12 +8,10 @@ Can be run independently for testing:
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
+from typing import Tuple
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
-from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
 
@@ -31,65 +29,42 @@ class VoiceTraitsBuilderTool(WorkflowStep):
     def get_output_fields(self):
         return ['voice_traits', 'actionable_guidelines', 'communication_framework']
     
+    def build_prompt(self, context: WorkflowContext) -> Tuple[str, float]:
+        """Build the voice traits prompt and its temperature"""
+        get = context.get
+        
+        # Serialize each subtree once; the persona and voice audit JSON is
+        # both its own prompt argument and part of the brand context
+        brand_json = orjson.dumps({
+            'mission': get('brand_mission'),
+            'values': get('brand_values'),
+            'personality': get('brand_personality_traits')
+        }).decode()
+        audience_json = orjson.dumps(get('detailed_personas', {})).decode()
+        voice_json = orjson.dumps(get('voice_audit_summary', {})).decode()
+        content_json = orjson.dumps(get('content_samples', [])).decode()
+        
+        # Build comprehensive context from all previous steps
+        brand_context = (
+            f'{{"brand_data":{brand_json},"audience_data":{audience_json},'
+            f'"voice_data":{voice_json},"content_data":{content_json}}}'
+        )
+        industry_context = f"Industry: {get('industry', 'General')}"
+        
+        # Get prompt using wrapper system
+        return prompt_wrapper.get_voice_traits_builder_prompt(
+            brand_context=brand_context,
+            audience_insights=audience_json,
+            voice_audit_results=voice_json,
+            industry_context=industry_context
+        )
+    
     def execute(self, context: WorkflowContext) -> StepResult:
         """Execute voice traits building"""
-        client_name = context.get('client_name')
-        
-        try:
-            # Build comprehensive context from all previous steps
-            comprehensive_insights = {
-                'brand_data': {
-                    'mission': context.get('brand_mission'),
-                    'values': context.get('brand_values'),
-                    'personality': context.get('brand_personality_traits')
-                },
-                'audience_data': context.get('detailed_personas', {}),
-                'voice_data': context.get('voice_audit_summary', {}),
-                'content_data': context.get('content_samples', [])
-            }
-            
-            brand_context = json.dumps(comprehensive_insights, indent=2)
-            industry_context = f"Industry: {context.get('industry', 'General')}"
-            
-            # Get prompt using wrapper system  
-            prompt, temperature = prompt_wrapper.get_voice_traits_builder_prompt(
-                brand_context=brand_context,
-                audience_insights=json.dumps(context.get('detailed_personas', {})),
-                voice_audit_results=json.dumps(context.get('voice_audit_summary', {})),
-                industry_context=industry_context
-            )
-            
-            # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
-                return StepResult(
-                    success=False,
-                    data={},
-                    errors=[f"API call failed: {response}"],
-                    warnings=[],
-                    step_name=self.name
-                )
-            
-            result_data = json.loads(response)
-            
-            return StepResult(
-                success=True,
-                data=result_data,
-                errors=[],
-                warnings=[],
-                step_name=self.name
-            )
-            
-        except Exception as e:
-            return StepResult(
-                success=False,
-                data={},
-                errors=[f"Voice traits building failed: {str(e)}"],
-                warnings=[],
-                step_name=self.name
-            )
+        return self.run_llm_step(self.build_prompt, context, "Voice traits building")
+
+
+STEP_CLASS = VoiceTraitsBuilderTool
 
 
 def main():
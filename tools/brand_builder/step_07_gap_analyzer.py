@@ -8,12 +8,10 @@ Can be run independently for testing:
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import orjson
+from typing import Tuple
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
-from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
 
@@ -31,63 +29,39 @@ class GapAnalyzerTool(WorkflowStep):
     def get_output_fields(self):
         return ['competitive_analysis', 'strategic_gaps', 'opportunities']
     
+    def build_prompt(self, context: WorkflowContext) -> Tuple[str, float]:
+        """Build the gap analysis prompt and its temperature"""
+        get = context.get
+        client_name = get('client_name')
+        voice_traits = get('voice_traits', {})
+        
+        # Build comprehensive context for competitive analysis
+        brand_positioning = {
+            'company': client_name,
+            'industry': get('industry'),
+            'voice_traits': voice_traits,
+            'audience_personas': get('detailed_personas', {}),
+            'brand_values': get('brand_values'),
+            'differentiation': get('competitive_differentiation')
+        }
+        
+        market_context = f"Industry: {get('industry', 'General')} market analysis"
+        voice_strategy = orjson.dumps(voice_traits).decode()
+        
+        # Get prompt using wrapper system
+        return prompt_wrapper.get_gap_analyzer_prompt(
+            brand_positioning=orjson.dumps(brand_positioning).decode(),
+            market_context=market_context,
+            voice_strategy=voice_strategy,
+            competitive_context=get('competitive_differentiation', 'Not specified')
+        )
+    
     def execute(self, context: WorkflowContext) -> StepResult:
         """Execute gap analysis"""
-        client_name = context.get('client_name')
-        
-        try:
-            # Build comprehensive context for competitive analysis
-            brand_positioning = {
-                'company': client_name,
-                'industry': context.get('industry'),
-                'voice_traits': context.get('voice_traits', {}),
-                'audience_personas': context.get('detailed_personas', {}),
-                'brand_values': context.get('brand_values'),
-                'differentiation': context.get('competitive_differentiation')
-            }
-            
-            market_context = f"Industry: {context.get('industry', 'General')} market analysis"
-            voice_strategy = json.dumps(context.get('voice_traits', {}), indent=2)
-            
-            # Get prompt using wrapper system
-            prompt, temperature = prompt_wrapper.get_gap_analyzer_prompt(
-                brand_positioning=json.dumps(brand_positioning, indent=2),
-                market_context=market_context,
-                voice_strategy=voice_strategy,
-                competitive_context=context.get('competitive_differentiation', 'Not specified')
-            )
-            
-            # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
-                return StepResult(
-                    success=False,
-                    data={},
-                    errors=[f"API call failed: {response}"],
-                    warnings=[],
-                    step_name=self.name
-                )
-            
-            result_data = json.loads(response)
-            
-            return StepResult(
-                success=True,
-                data=result_data,
-                errors=[],
-                warnings=[],
-                step_name=self.name
-            )
-            
-        except Exception as e:
-            return StepResult(
-                success=False,
-                data={},
-                errors=[f"Gap analysis failed: {str(e)}"],
-                warnings=[],
-                step_name=self.name
-            )
+        return self.run_llm_step(self.build_prompt, context, "Gap analysis")
+
+
+STEP_CLASS = GapAnalyzerTool
 
 
 def main():
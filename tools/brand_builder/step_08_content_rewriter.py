@@ -5,14 +5,16 @@ Transforms content samples based on brand insights and voice guidelines.
 
 Can be run independently for testing:
     python -m tools.brand_builder.step_08_content_rewriter --input step7_output.json --client "Test Client"
+
+Or for many clients' inputs at once:
+    python -m tools.brand_builder.step_08_content_rewriter --input-glob "step7_outputs/*.json" --client "Test Client" --output step8_outputs
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
+from tools.brand_builder._batch import run_batch
+from tools.brand_builder._cache import cached_gemini_call
 from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
@@ -60,14 +62,16 @@ class ContentRewriterTool(WorkflowStep):
             )
             
             # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
+            try:
+                response = cached_gemini_call(
+                    universal_framework.call_gemini_api, prompt, temperature=temperature,
+                    model=universal_framework.GEMINI_MODEL
+                )
+            except universal_framework.GeminiAPIError as e:
                 return StepResult(
                     success=False,
                     data={},
-                    errors=[f"API call failed: {response}"],
+                    errors=[f"API call failed: {e}"],
                     warnings=[],
                     step_name=self.name
                 )
@@ -92,17 +96,25 @@ class ContentRewriterTool(WorkflowStep):
             )
 
 
+STEP_CLASS = ContentRewriterTool
+
+
 def main():
     """CLI interface for testing step independently"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Rewrite content for Brand Builder')
-    parser.add_argument('--client', required=True, help='Client name')
+    parser.add_argument('--client', required=True, help='Client name (default for --input-glob files without one)')
     parser.add_argument('--input', help='Input JSON file from previous steps')
-    parser.add_argument('--output', help='Output file for results (JSON)')
+    parser.add_argument('--input-glob', help='Glob of input JSON files to run in one batch, e.g. "step7_outputs/*.json"')
+    parser.add_argument('--output', help='Output file for results (JSON), or a directory with --input-glob')
     
     args = parser.parse_args()
     
+    if args.input_glob:
+        run_batch(ContentRewriterTool(), args.input_glob, args.client, args.output)
+        return
+    
     # Create context
     context_data = {'client_name': args.client}
     
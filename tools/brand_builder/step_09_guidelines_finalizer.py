@@ -6,14 +6,16 @@ This is the final step that produces the turnkey guidelines.
 
 Can be run independently for testing:
     python -m tools.brand_builder.step_09_guidelines_finalizer --input step8_output.json --client "Test Client"
+
+Or for many clients' inputs at once:
+    python -m tools.brand_builder.step_09_guidelines_finalizer --input-glob "step8_outputs/*.json" --client "Test Client" --output step9_outputs
 """
 
 import json
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from tools.brand_builder import WorkflowStep, WorkflowContext, StepResult
+from tools.brand_builder._batch import run_batch
+from tools.brand_builder._cache import cached_gemini_call
 from frameworks import universal_framework
 from frameworks.prompt_wrappers import prompt_wrapper
 
@@ -62,14 +64,16 @@ class GuidelinesFinalizerTool(WorkflowStep):
             )
             
             # Call API
-            response = universal_framework.call_gemini_api(prompt, temperature=temperature)
-            
-            # Check for API error responses
-            if response.startswith("Error:"):
+            try:
+                response = cached_gemini_call(
+                    universal_framework.call_gemini_api, prompt, temperature=temperature,
+                    model=universal_framework.GEMINI_MODEL
+                )
+            except universal_framework.GeminiAPIError as e:
                 return StepResult(
                     success=False,
                     data={},
-                    errors=[f"API call failed: {response}"],
+                    errors=[f"API call failed: {e}"],
                     warnings=[],
                     step_name=self.name
                 )
@@ -94,17 +98,25 @@ class GuidelinesFinalizerTool(WorkflowStep):
             )
 
 
+STEP_CLASS = GuidelinesFinalizerTool
+
+
 def main():
     """CLI interface for testing step independently"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Finalize brand guidelines for Brand Builder')
-    parser.add_argument('--client', required=True, help='Client name')
+    parser.add_argument('--client', required=True, help='Client name (default for --input-glob files without one)')
     parser.add_argument('--input', help='Input JSON file from previous steps')
-    parser.add_argument('--output', help='Output file for results (JSON)')
+    parser.add_argument('--input-glob', help='Glob of input JSON files to run in one batch, e.g. "step8_outputs/*.json"')
+    parser.add_argument('--output', help='Output file for results (JSON), or a directory with --input-glob')
     
     args = parser.parse_args()
     
+    if args.input_glob:
+        run_batch(GuidelinesFinalizerTool(), args.input_glob, args.client, args.output)
+        return
+    
     # Create context
     context_data = {'client_name': args.client}
     
@@ -12,6 +12,7 @@ REFACTORING NOTE: This tool has been updated to use the new modular prompt syste
 
 import streamlit as st
 import json
+import re
 import requests
 from bs4 import BeautifulSoup
 import trafilatura
@@ -24,6 +25,74 @@ from frameworks.prompt_wrappers import prompt_wrapper
 # NOTE: Load prompt configurations to ensure they're registered
 from prompts.structured.configs import context_gatherer_prompts
 
+# Output schema described to the model in the website extraction prompt
+_WEBSITE_PROMPT_SCHEMA = {
+    "industry": "Primary business sector/industry (be specific)",
+    "company_description": "Clear 2-3 sentence description of what the company does",
+    "key_products_services": ["Service 1", "Service 2", "Product 3"],
+    "contact_email": "Primary business email or 'Not found'",
+    "phone_number": "Primary phone number or 'Not found'",
+    "address": "Complete business address or 'Not found'",
+    "linkedin_url": "Full LinkedIn URL or 'Not found'",
+    "twitter_url": "Full Twitter/X URL or 'Not found'",
+    "facebook_url": "Full Facebook URL or 'Not found'",
+    "instagram_url": "Full Instagram URL or 'Not found'",
+    "youtube_url": "Full YouTube URL or 'Not found'",
+    "other_social_media": ["Additional social platform URLs"],
+    "target_markets": ["Market 1", "Market 2"],
+    "company_size_indicators": "Small/Medium/Large business indicators found",
+    "geographical_presence": "Locations served or mentioned"
+}
+
+# JSON schema for website extraction API validation (separate from the prompt schema above)
+_WEBSITE_API_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "industry": {"type": "string"},
+        "company_description": {"type": "string"},
+        "key_products_services": {"type": "array", "items": {"type": "string"}},
+        "contact_email": {"type": "string"},
+        "phone_number": {"type": "string"},
+        "address": {"type": "string"},
+        "linkedin_url": {"type": "string"},
+        "twitter_url": {"type": "string"},
+        "facebook_url": {"type": "string"},
+        "instagram_url": {"type": "string"},
+        "youtube_url": {"type": "string"},
+        "other_social_media": {"type": "array", "items": {"type": "string"}},
+        "target_markets": {"type": "array", "items": {"type": "string"}},
+        "company_size_indicators": {"type": "string"},
+        "geographical_presence": {"type": "string"}
+    },
+    "required": ["industry", "company_description", "key_products_services"]
+}
+
+# JSON schema for brand voice analysis API validation
+_BRAND_VOICE_API_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "current_target_audience": {"type": "string"},
+        "ideal_target_audience": {"type": "string"},
+        "brand_values": {"type": "array", "items": {"type": "string"}},
+        "brand_mission": {"type": "string"},
+        "value_proposition": {"type": "string"},
+        "brand_personality_traits": {"type": "array", "items": {"type": "string"}},
+        "communication_tone": {"type": "string"},
+        "voice_characteristics": {"type": "array", "items": {"type": "string"}},
+        "language_level": {"type": "string"},
+        "desired_emotional_impact": {"type": "array", "items": {"type": "string"}},
+        "brand_archetypes": {"type": "array", "items": {"type": "string"}},
+        "competitive_differentiation": {"type": "string"},
+        "content_themes": {"type": "array", "items": {"type": "string"}},
+        "words_tones_to_avoid": {"type": "array", "items": {"type": "string"}},
+        "messaging_priorities": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["current_target_audience", "ideal_target_audience", "brand_values", "brand_mission", "brand_personality_traits"]
+}
+
+# A response that is entirely one ```json (or bare ```) fenced block
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.DOTALL)
+
 def extract_targeted_content(base_url):
     """
     Extract content from multiple targeted pages on a website
@@ -149,7 +218,6 @@ def extract_content_from_url(url):
             text = '\n'.join(chunk for chunk in chunks if chunk)
             
             # Extract contact information patterns from text
-            import re
             contact_info = []
             
             # Find email patterns in text
@@ -214,58 +282,17 @@ def extract_website_data(client_name, website_url):
         
         # NOTE: Use new modular prompt system instead of inline prompt
         # This provides better maintainability and consistency across the application
-        schema = {
-            "industry": "Primary business sector/industry (be specific)",
-            "company_description": "Clear 2-3 sentence description of what the company does",
-            "key_products_services": ["Service 1", "Service 2", "Product 3"],
-            "contact_email": "Primary business email or 'Not found'",
-            "phone_number": "Primary phone number or 'Not found'",
-            "address": "Complete business address or 'Not found'",
-            "linkedin_url": "Full LinkedIn URL or 'Not found'",
-            "twitter_url": "Full Twitter/X URL or 'Not found'",
-            "facebook_url": "Full Facebook URL or 'Not found'",
-            "instagram_url": "Full Instagram URL or 'Not found'",
-            "youtube_url": "Full YouTube URL or 'Not found'",
-            "other_social_media": ["Additional social platform URLs"],
-            "target_markets": ["Market 1", "Market 2"],
-            "company_size_indicators": "Small/Medium/Large business indicators found",
-            "geographical_presence": "Locations served or mentioned"
-        }
-        
         # NOTE: Get prompt and temperature from new system with fallback capability
         prompt, temperature = prompt_wrapper.get_website_extraction_prompt(
             client_name=client_name,
             website_url=website_url,
             content_input=content_input,
-            schema=schema
+            schema=_WEBSITE_PROMPT_SCHEMA
         )
         
-        # NOTE: Create JSON schema for API validation (separate from the prompt schema above)
-        api_schema = {
-            "type": "object",
-            "properties": {
-                "industry": {"type": "string"},
-                "company_description": {"type": "string"},
-                "key_products_services": {"type": "array", "items": {"type": "string"}},
-                "contact_email": {"type": "string"},
-                "phone_number": {"type": "string"},
-                "address": {"type": "string"},
-                "linkedin_url": {"type": "string"},
-                "twitter_url": {"type": "string"},
-                "facebook_url": {"type": "string"},
-                "instagram_url": {"type": "string"},
-                "youtube_url": {"type": "string"},
-                "other_social_media": {"type": "array", "items": {"type": "string"}},
-                "target_markets": {"type": "array", "items": {"type": "string"}},
-                "company_size_indicators": {"type": "string"},
-                "geographical_presence": {"type": "string"}
-            },
-            "required": ["industry", "company_description", "key_products_services"]
-        }
-        
         # NOTE: Use temperature from prompt system instead of hardcoded value
         # This allows easy tuning through prompt configuration
-        response = universal_framework.call_gemini_api(prompt, response_schema=api_schema, temperature=temperature)
+        response = universal_framework.call_gemini_api(prompt, response_schema=_WEBSITE_API_SCHEMA, temperature=temperature)
         result_data = json.loads(response)
         return True, result_data, None
             
@@ -296,46 +323,18 @@ def analyze_brand_voice(client_name, website_data, form_data=None):
             form_data=form_data
         )
         
-        # NOTE: Define API schema for brand voice analysis validation
-        api_schema = {
-            "type": "object",
-            "properties": {
-                "current_target_audience": {"type": "string"},
-                "ideal_target_audience": {"type": "string"},
-                "brand_values": {"type": "array", "items": {"type": "string"}},
-                "brand_mission": {"type": "string"},
-                "value_proposition": {"type": "string"},
-                "brand_personality_traits": {"type": "array", "items": {"type": "string"}},
-                "communication_tone": {"type": "string"},
-                "voice_characteristics": {"type": "array", "items": {"type": "string"}},
-                "language_level": {"type": "string"},
-                "desired_emotional_impact": {"type": "array", "items": {"type": "string"}},
-                "brand_archetypes": {"type": "array", "items": {"type": "string"}},
-                "competitive_differentiation": {"type": "string"},
-                "content_themes": {"type": "array", "items": {"type": "string"}},
-                "words_tones_to_avoid": {"type": "array", "items": {"type": "string"}},
-                "messaging_priorities": {"type": "array", "items": {"type": "string"}}
-            },
-            "required": ["current_target_audience", "ideal_target_audience", "brand_values", "brand_mission", "brand_personality_traits"]
-        }
-        
         # NOTE: Use temperature from prompt system (0.7 for creative brand analysis)
-        response = universal_framework.call_gemini_api(prompt, response_schema=api_schema, temperature=temperature)
+        response = universal_framework.call_gemini_api(prompt, response_schema=_BRAND_VOICE_API_SCHEMA, temperature=temperature)
         
         # Enhanced JSON parsing with error handling
         try:
-            # Clean the response
-            clean_response = response.strip()
-            if clean_response.startswith('```json'):
-                clean_response = clean_response[7:]
-            if clean_response.endswith('```'):
-                clean_response = clean_response[:-3]
-            clean_response = clean_response.strip()
+            # Unwrap a fenced response in one pass
+            fence = _FENCE_RE.match(response)
+            clean_response = fence.group(1) if fence else response.strip()
             
             result_data = json.loads(clean_response)
         except json.JSONDecodeError as e:
             # Try to extract JSON from response with better pattern matching
-            import re
             # Look for JSON object starting with { and ending with }
             json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response, re.DOTALL)
             if not json_match: